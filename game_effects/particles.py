@@ -1,43 +1,177 @@
 import pygame
-import random
-
-class Particle:
-    def __init__(self, x, y, color=(0, 120, 255, 180)):
-        self.x = x
-        self.y = y
-        angle = random.uniform(0, 2 * 3.14159)
-        speed = random.uniform(1, 3)
-        self.vx = speed * random.uniform(0.5, 1.0) * random.choice([-1, 1])
-        self.vy = speed * random.uniform(0.5, 1.0) * random.choice([-1, 1])
-        self.radius = random.randint(4, 7)
-        self.life = random.randint(15, 25)
-        self.color = color
+from game_helpers.dirty_rects import dirty_rects
+from game_helpers.render_queue import queue_blits
+from game_helpers.perf_counters import perf_counters
 
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += 0.1 
-        self.life -= 1
+MAX_PARTICLES = 20000 # hard cap on live particles, new ones are dropped beyond it
+GRAVITY = 0.1 # added to vy on every update
+RADIUS_RANGE = (4, 7) # inclusive
+LIFE_RANGE = (15, 25) # updates, inclusive
+SPEED_RANGE = (1, 3)
+
+
+class ParticleEngine:
+    """
+    One shared particle simulation for the whole game.
+
+    Particles live in NumPy arrays (structure of arrays: x, y, vx, vy, life,
+    radius, color index) and are moved in one vectorized step per update.
+    Each particle is drawn from a cached circle sprite for its (radius, color),
+    all in a single Surface.blits call. NumPy is imported on the first emit.
+    """
+    def __init__(self, max_particles: int = MAX_PARTICLES):
+        self.max_particles = max_particles
+        self.count = 0
+        self.stepped = 0 # particles [0, stepped) have been updated since they were emitted, later ones are new
+        self.np = None
+        self.rng = None
+        self.colors: list[tuple] = [] # color index -> RGBA
+        self.color_indices: dict[tuple, int] = {}
+        self.sprites: dict[tuple[int, int], pygame.Surface] = {} # (radius, color index) -> circle sprite
+        self.sprite_table = None # object array indexed by radius * len(colors) + color index
+        self.view_size = None # size of the surface drawn to, particles that left it for good are culled
+        self.interpolation = 1.0 # how far drawing is between the last two updates, 0..1, set by the game loop
 
-    def draw(self, screen):
-        if self.life > 0:
-            surf = pygame.Surface((self.radius*2, self.radius*2), pygame.SRCALPHA)
-            pygame.draw.circle(surf, self.color, (self.radius, self.radius), self.radius)
-            screen.blit(surf, (self.x - self.radius, self.y - self.radius))
+        self.emitted = 0
+        self.dropped = 0
 
-class ParticleSystem:
-    def __init__(self):
-        self.particles = []
+    def _allocate(self):
+        import numpy as np
+        self.np = np
+        self.rng = np.random.default_rng()
+        self.x = np.zeros(self.max_particles, np.float32)
+        self.y = np.zeros(self.max_particles, np.float32)
+        self.vx = np.zeros(self.max_particles, np.float32)
+        self.vy = np.zeros(self.max_particles, np.float32)
+        self.life = np.zeros(self.max_particles, np.int16)
+        self.radius = np.zeros(self.max_particles, np.int16)
+        self.color = np.zeros(self.max_particles, np.int16)
 
-    def emit(self, x, y, count=12, color=(0, 120, 255, 180)):
-        for _ in range(count):
-            self.particles.append(Particle(x, y, color))
+    def _color_index(self, color: tuple) -> int:
+        color = tuple(color)
+        index = self.color_indices.get(color)
+        if index is None:
+            index = len(self.colors)
+            self.colors.append(color)
+            self.color_indices[color] = index
+            self.sprite_table = None
+        return index
+
+    def emit(self, x: float, y: float, count: int = 12, color: tuple = (0, 120, 255, 180)):
+        """Spawns a burst at (x, y) flying out in random diagonal directions."""
+        if self.np is None:
+            self._allocate()
+        accepted = min(count, self.max_particles - self.count)
+        self.dropped += count - accepted
+        if accepted <= 0:
+            return
+        rng = self.rng
+        start, end = self.count, self.count + accepted
+        speed = rng.uniform(*SPEED_RANGE, accepted)
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.vx[start:end] = speed * rng.uniform(0.5, 1.0, accepted) * rng.choice((-1, 1), accepted)
+        self.vy[start:end] = speed * rng.uniform(0.5, 1.0, accepted) * rng.choice((-1, 1), accepted)
+        self.radius[start:end] = rng.integers(RADIUS_RANGE[0], RADIUS_RANGE[1] + 1, accepted)
+        self.life[start:end] = rng.integers(LIFE_RANGE[0], LIFE_RANGE[1] + 1, accepted)
+        self.color[start:end] = self._color_index(color)
+        self.count = end
+        self.emitted += accepted
 
     def update(self):
-        for p in self.particles:
-            p.update()
-        self.particles = [p for p in self.particles if p.life > 0]
+        """Advances every particle one step and drops the dead ones."""
+        n = self.count
+        if n == 0:
+            return
+        track = dirty_rects.enabled
+        if track:
+            dirty_rects.mark(self.bounds())
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.vy[:n] += GRAVITY
+        self.life[:n] -= 1
+
+        alive = self.life[:n] > 0
+        if self.view_size is not None:
+            # Velocities only change by gravity, so particles past the sides or the bottom never come back
+            radius = self.radius[:n]
+            alive &= self.y[:n] - radius < self.view_size[1]
+            alive &= (self.x[:n] + radius > 0) | (self.vx[:n] > 0)
+            alive &= (self.x[:n] - radius < self.view_size[0]) | (self.vx[:n] < 0)
+        kept = int(alive.sum())
+        if kept < n:
+            for array in (self.x, self.y, self.vx, self.vy, self.life, self.radius, self.color):
+                array[:kept] = array[:n][alive]
+            self.count = kept
+        self.stepped = self.count
+        if track:
+            dirty_rects.mark(self.bounds())
+
+    def bounds(self) -> pygame.Rect | None:
+        """Bounding box of every live particle, None when there are none."""
+        n = self.count
+        if n == 0:
+            return None
+        radius = self.radius[:n]
+        left = float((self.x[:n] - radius).min())
+        top = float((self.y[:n] - radius).min())
+        right = float((self.x[:n] + radius).max())
+        bottom = float((self.y[:n] + radius).max())
+        return pygame.Rect(int(left) - 1, int(top) - 1, int(right - left) + 3, int(bottom - top) + 3)
+
+    def get_sprite(self, radius: int, color_index: int) -> pygame.Surface:
+        sprite = self.sprites.get((radius, color_index))
+        if sprite is None:
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, self.colors[color_index], (radius, radius), radius)
+            perf_counters.incr("surfaces")
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            self.sprites[(radius, color_index)] = sprite
+        return sprite
+
+    def _build_sprite_table(self):
+        np = self.np
+        table = np.empty((RADIUS_RANGE[1] + 1) * len(self.colors), dtype=object)
+        for radius in range(RADIUS_RANGE[0], RADIUS_RANGE[1] + 1):
+            for color_index in range(len(self.colors)):
+                table[radius * len(self.colors) + color_index] = self.get_sprite(radius, color_index)
+        self.sprite_table = table
+
+    def draw(self, screen: pygame.Surface):
+        """Draws every live particle with one Surface.blits call, or queues them when a frame is open for screen."""
+        self.view_size = screen.get_size()
+        n = self.count
+        if n == 0:
+            return
+        np = self.np
+        if self.sprite_table is None:
+            self._build_sprite_table()
+        radius = self.radius[:n]
+        # Sprites are picked with one fancy-indexing step instead of a dictionary lookup per particle
+        sprites = self.sprite_table[radius.astype(np.intp) * len(self.colors) + self.color[:n]]
+        positions = np.empty((n, 2), np.int32) # float to int conversion truncates like blit does
+        # The last update moved each particle by (vx, vy - GRAVITY); step back by the part of it not yet due
+        behind = 1.0 - self.interpolation
+        positions[:, 0] = self.x[:n] - self.vx[:n] * behind - radius
+        positions[:, 1] = self.y[:n] - (self.vy[:n] - GRAVITY) * behind - radius
+        # Particles emitted since the last update have not moved yet, so they stay where they were spawned
+        positions[self.stepped:n, 0] = self.x[self.stepped:n] - radius[self.stepped:n]
+        positions[self.stepped:n, 1] = self.y[self.stepped:n] - radius[self.stepped:n]
+        queue_blits(screen, list(zip(sprites.tolist(), positions.tolist())))
+
+    def clear(self):
+        self.count = 0
+        self.stepped = 0
+
+    def stats(self) -> dict:
+        return {
+            "live": self.count,
+            "emitted": self.emitted,
+            "dropped": self.dropped,
+            "sprites": len(self.sprites),
+        }
+
+
+particle_engine = ParticleEngine()
 
-    def draw(self, screen):
-        for p in self.particles:
-            p.draw(screen)
\ No newline at end of file
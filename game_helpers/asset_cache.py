@@ -0,0 +1,174 @@
+from collections import OrderedDict
+import threading
+import pygame
+from game_helpers.perf_counters import perf_counters
+
+IMAGE_CACHE_BUDGET = 64 * 1024 * 1024 # bytes of decoded surfaces kept in memory
+
+
+class ImageCache:
+    """
+    Shares converted, pre-scaled Surfaces keyed by (path, target_size, alpha).
+    Surfaces handed out are shared between objects and must not be drawn on.
+    """
+    def __init__(self, budget: int = IMAGE_CACHE_BUDGET):
+        """
+        Args:
+            budget (int): Maximum number of bytes of surfaces to keep before evicting the least recently used.
+        """
+        self.budget = budget
+        self.surfaces: OrderedDict = OrderedDict() # key -> (Surface, nbytes)
+        self.cached_bytes = 0
+        self.atlas = None # TextureAtlas consulted before the cache, see texture_atlas.build_default_atlas
+        self.asset_pack = None # baked AssetPack consulted before decoding from disk
+        self.lock = threading.Lock() # guards the load counters, read() updates them from loader threads
+
+        self.hits = 0
+        self.misses = 0
+        self.disk_loads = 0
+        self.scales = 0
+        self.pack_loads = 0
+        self.evictions = 0
+
+    def load(self, path: str, size: tuple[int, int] = None, alpha: bool = True) -> pygame.Surface:
+        """
+        Returns the image at path converted for the display and scaled to size.
+
+        Args:
+            path (str): Image file path.
+            size (tuple[int, int]): Target size, None keeps the original size.
+            alpha (bool): Convert with per-pixel alpha (convert_alpha) or without (convert).
+        """
+        key = (path, tuple(size) if size is not None else None, alpha)
+        if self.atlas is not None and alpha and key[1] is not None:
+            region = self.atlas.get(path, key[1])
+            if region is not None:
+                self.hits += 1
+                return region
+
+        entry = self.surfaces.get(key)
+        if entry is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        baked = self.asset_pack.get(path, key[1]) if self.asset_pack is not None and alpha else None
+        if baked is not None:
+            with self.lock:
+                self.pack_loads += 1
+            self.put(key, baked, 0)
+            return baked
+
+        if key[1] is None:
+            image = self._decode(path, alpha)
+        else:
+            source_entry = self.surfaces.get((path, None, alpha))
+            source = source_entry[0] if source_entry is not None else self._decode(path, alpha)
+            # Keep small sources around for other sizes, large ones (backgrounds) only in their scaled form
+            if source_entry is None and source.get_pitch() * source.get_height() <= self.budget // 16:
+                self.put((path, None, alpha), source)
+            image = source if source.get_size() == key[1] else pygame.transform.scale(source, key[1])
+            with self.lock:
+                self.scales += 1
+        self.put(key, image)
+        return image
+
+    def read(self, path: str, size: tuple[int, int] = None, alpha: bool = True) -> tuple[pygame.Surface, bool]:
+        """
+        Decodes and scales an image without converting it or touching the cache,
+        so it is safe to call from a loader thread. Pass the result to add().
+
+        Returns:
+            tuple[pygame.Surface, bool]: The surface and whether it still needs converting for the display.
+        """
+        size = tuple(size) if size is not None else None
+        baked = self.asset_pack.get(path, size) if self.asset_pack is not None and alpha else None
+        if baked is not None:
+            with self.lock:
+                self.pack_loads += 1
+            return baked, False
+        image = pygame.image.load(path)
+        with self.lock:
+            self.disk_loads += 1
+        perf_counters.incr("image_loads")
+        if size is not None and image.get_size() != size:
+            image = pygame.transform.scale(image, size)
+            with self.lock:
+                self.scales += 1
+            perf_counters.incr("surfaces")
+        return image, True
+
+    def add(self, path: str, size: tuple[int, int], image: pygame.Surface, needs_convert: bool = True, alpha: bool = True) -> pygame.Surface:
+        """Converts an image returned by read() on the main thread and stores it in the cache."""
+        if needs_convert:
+            image = image.convert_alpha() if alpha else image.convert()
+        # Only baked surfaces skip converting; their pixels live in the pack's mapping
+        self.put((path, tuple(size) if size is not None else None, alpha), image, None if needs_convert else 0)
+        return image
+
+    def contains(self, path: str, size: tuple[int, int] = None, alpha: bool = True) -> bool:
+        """True if load() would return without decoding anything."""
+        size = tuple(size) if size is not None else None
+        if self.atlas is not None and alpha and size is not None and self.atlas.get(path, size) is not None:
+            return True
+        return (path, size, alpha) in self.surfaces
+
+    def _decode(self, path: str, alpha: bool) -> pygame.Surface:
+        image = pygame.image.load(path)
+        with self.lock:
+            self.disk_loads += 1
+        perf_counters.incr("image_loads")
+        return image.convert_alpha() if alpha else image.convert()
+
+    def put(self, key, image: pygame.Surface, nbytes: int = None):
+        """
+        Stores a surface under a cache key, evicting old entries to stay under the budget.
+
+        Args:
+            nbytes (int): Memory the entry holds, the surface's pixel size when None. Surfaces
+                mapped from the asset pack pass 0, since evicting them frees nothing.
+        """
+        old = self.surfaces.pop(key, None)
+        if old is not None:
+            self.cached_bytes -= old[1]
+        if nbytes is None:
+            nbytes = image.get_pitch() * image.get_height()
+        self.surfaces[key] = (image, nbytes)
+        self.cached_bytes += nbytes
+        while self.cached_bytes > self.budget and len(self.surfaces) > 1:
+            _, (_, evicted_bytes) = self.surfaces.popitem(last=False)
+            self.cached_bytes -= evicted_bytes
+            self.evictions += 1
+
+    def discard(self, path: str, size: tuple[int, int] = None, alpha: bool = True):
+        """Drops one entry, e.g. once it is served from the atlas instead."""
+        entry = self.surfaces.pop((path, tuple(size) if size is not None else None, alpha), None)
+        if entry is not None:
+            self.cached_bytes -= entry[1]
+
+    def clear(self):
+        self.surfaces.clear()
+        self.cached_bytes = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "disk_loads": self.disk_loads,
+            "scales": self.scales,
+            "pack_loads": self.pack_loads,
+            "evictions": self.evictions,
+            "surfaces": len(self.surfaces),
+            "cached_bytes": self.cached_bytes,
+        }
+
+
+image_cache = ImageCache()
+
+
+def load_image(path: str, size: tuple[int, int] = None, alpha: bool = True) -> pygame.Surface:
+    """Loads an image through the shared cache, see ImageCache.load."""
+    return image_cache.load(path, size, alpha)
@@ -0,0 +1,121 @@
+from concurrent.futures import ThreadPoolExecutor
+import os
+import queue
+import time
+from game_helpers.asset_cache import image_cache
+from game_helpers.startup_trace import startup_trace
+
+LOADER_WORKERS = min(4, os.cpu_count() or 1)
+PUMP_BUDGET_MS = 4 # main-thread time per frame spent finishing loaded assets
+
+
+class LoadJob:
+    """One piece of loading work tracked by an AssetLoader group."""
+    def __init__(self, group: str, finish=None, name: str = None):
+        self.group = group
+        self.finish = finish
+        self.name = name
+        self.done = False
+        self.error = None # exception raised by the job's work, if it failed
+
+
+class AssetLoader:
+    """
+    Decodes and scales assets on a thread pool. Anything that needs the display
+    (convert_alpha, building game objects) happens in a job's finish step,
+    which pump() runs on the main thread a few at a time so frames keep coming.
+    """
+    def __init__(self, workers: int = LOADER_WORKERS):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="asset-loader")
+        self.finished = queue.Queue() # (job, result, error) waiting for the main thread
+        self.groups: dict[str, list[LoadJob]] = {}
+        self.failures = 0
+        self.last_error = None # "name: error" of the most recent failed job
+
+    def submit(self, group: str, work=None, finish=None, name: str = None) -> LoadJob:
+        """
+        Queues a job.
+
+        Args:
+            group (str): Jobs are tracked per group, e.g. everything the playing scene needs.
+            work (callable): Runs on a loader thread and must not touch the display. None skips straight to finish.
+            finish (callable): Called on the main thread with the result of work (None if there is no work).
+            name (str): Startup trace phase marked once the job is done.
+        """
+        job = LoadJob(group, finish, name)
+        self.groups.setdefault(group, []).append(job)
+        if work is None:
+            self.finished.put((job, None, None))
+        else:
+            future = self.executor.submit(work)
+
+            def hand_back(future):
+                error = future.exception()
+                if error is not None:
+                    self.finished.put((job, None, error))
+                else:
+                    self.finished.put((job, future.result(), None))
+
+            future.add_done_callback(hand_back)
+        return job
+
+    def load_image(self, group: str, path: str, size: tuple[int, int] = None, on_ready=None) -> LoadJob | None:
+        """
+        Loads an image into the shared image cache in the background.
+
+        Args:
+            on_ready (callable): Called on the main thread with the converted surface.
+                If the image is already cached it is called right away.
+        """
+        if image_cache.contains(path, size):
+            if on_ready is not None:
+                on_ready(image_cache.load(path, size))
+            return None
+
+        def finish(result):
+            image = image_cache.add(path, size, *result)
+            if on_ready is not None:
+                on_ready(image)
+        return self.submit(group, lambda: image_cache.read(path, size), finish)
+
+    def pump(self, budget_ms: float | None = PUMP_BUDGET_MS):
+        """Runs finish steps of completed jobs until budget_ms is used up. None runs every completed job."""
+        start = time.perf_counter()
+        while budget_ms is None or (time.perf_counter() - start) * 1000 < budget_ms:
+            try:
+                job, result, error = self.finished.get_nowait()
+            except queue.Empty:
+                return
+            self._finish(job, result, error)
+
+    def wait(self, group: str):
+        """Blocks until every job of a group is done, e.g. when the player skips ahead."""
+        while not self.is_ready(group):
+            self._finish(*self.finished.get())
+
+    def _finish(self, job: LoadJob, result, error):
+        if error is not None:
+            job.error = error
+            self.failures += 1
+            self.last_error = f"{job.name or job.group}: {error}"
+        elif job.finish is not None:
+            job.finish(result)
+        job.done = True
+        if job.name:
+            startup_trace.mark(job.name)
+
+    def progress(self, group: str) -> float:
+        """Fraction of a group's jobs that are done, 1.0 for an unknown group."""
+        jobs = self.groups.get(group)
+        if not jobs:
+            return 1.0
+        return sum(1 for job in jobs if job.done) / len(jobs)
+
+    def is_ready(self, group: str) -> bool:
+        return all(job.done for job in self.groups.get(group, ()))
+
+    def busy(self) -> bool:
+        return any(not job.done for jobs in self.groups.values() for job in jobs)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,195 @@
+# Offline asset baking and the memory-mapped asset pack read at runtime.
+# Bake with: python -m game_helpers.asset_pack [--output build/assets.pack] [--jobs N]
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+import pygame
+
+ASSET_PACK_PATH = "build/assets.pack"
+PACK_MAGIC = b"PBAP"
+PACK_VERSION = 1
+PACK_HEADER = struct.Struct("<4sII") # magic, version, index length
+PIXEL_FORMAT = "BGRA" # byte order of the 32-bit display surfaces pygame creates
+RAW_IMAGE_DIR = "assets/unpreparated_assets"
+RAW_IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+SCREEN_SIZE = (832, 640)
+
+
+def entry_key(path: str, size) -> str:
+    return f"{path}@{size[0]}x{size[1]}" if size is not None else f"{path}@native"
+
+
+def source_hash(path: str, size) -> str:
+    """Content hash of the source file plus the size it is baked at."""
+    digest = hashlib.sha1(entry_key("", size).encode())
+    with open(path, 'rb') as f:
+        digest.update(f.read())
+    return digest.hexdigest()
+
+
+class AssetPack:
+    """
+    Read-only view of a baked asset pack. Surfaces are built straight from the
+    memory-mapped pixel data, so nothing is decoded at runtime. Their pixels
+    are read-only like every shared image_cache surface: copy() one before
+    drawing on it.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.file = open(path, 'rb')
+        self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, index_length = PACK_HEADER.unpack_from(self.mm, 0)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            raise ValueError(f"{path} is not a version {PACK_VERSION} asset pack")
+        index_start = PACK_HEADER.size
+        self.index = json.loads(self.mm[index_start:index_start + index_length].decode('utf-8'))
+        self.data_start = _align(index_start + index_length)
+        self.fresh_entries: dict[str, bool] = {}
+
+        self.hits = 0
+        self.stale = 0
+
+    @classmethod
+    def open(cls, path: str = ASSET_PACK_PATH):
+        """Returns the pack at path, or None if there is no usable pack."""
+        if not os.path.exists(path):
+            return None
+        try:
+            return cls(path)
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Ignoring asset pack {path}: {e}")
+            return None
+
+    def get(self, path: str, size=None) -> pygame.Surface | None:
+        """Returns the baked surface for (path, size) or None if it is not in the pack or out of date."""
+        size = tuple(size) if size is not None else None
+        entry = self.index["entries"].get(entry_key(path, size))
+        if entry is None:
+            return None
+        if not self._is_fresh(path, size, entry):
+            self.stale += 1
+            return None
+        start = self.data_start + entry["offset"]
+        width, height = entry["size"]
+        pixels = memoryview(self.mm)[start:start + width * height * 4]
+        self.hits += 1
+        return pygame.image.frombuffer(pixels, (width, height), self.index["format"])
+
+    def _is_fresh(self, path: str, size, entry: dict) -> bool:
+        """
+        True if the source still matches what was baked. Size and mtime are checked first; a file
+        that only has a new mtime (e.g. after a checkout) is compared by its content hash.
+        """
+        key = entry_key(path, size)
+        fresh = self.fresh_entries.get(key)
+        if fresh is None:
+            try:
+                stat = os.stat(path)
+                fresh = stat.st_size == entry["source_size"] and (
+                    stat.st_mtime_ns == entry["source_mtime_ns"] or source_hash(path, size) == entry["hash"])
+            except OSError:
+                fresh = False
+            self.fresh_entries[key] = fresh
+        return fresh
+
+
+def _align(offset: int, alignment: int = 16) -> int:
+    return (offset + alignment - 1) // alignment * alignment
+
+
+def bake_entries(screen_size: tuple[int, int] = SCREEN_SIZE) -> list[tuple]:
+    """Every (path, size) the game draws, plus the raw source sheets at native size."""
+    from game_helpers.texture_atlas import default_atlas_entries
+    from game_helpers.game_initializer import SOIL_SIZE
+
+    entries = default_atlas_entries(SOIL_SIZE)
+    entries.append(("assets/backgrounds/backgroundLogo.jpg", tuple(screen_size)))
+    entries.append(("assets/logos/logo.png", (120, 120)))
+    for filename in sorted(os.listdir(RAW_IMAGE_DIR)):
+        if filename.lower().endswith(RAW_IMAGE_EXTENSIONS):
+            entries.append((os.path.join(RAW_IMAGE_DIR, filename).replace(os.sep, "/"), None))
+    return list(dict.fromkeys(entries))
+
+
+def _bake_image(path: str, size) -> tuple[tuple[int, int], bytes]:
+    """Decodes and scales one image in a worker process."""
+    image = pygame.image.load(path)
+    if size is not None and image.get_size() != tuple(size):
+        image = pygame.transform.scale(image, size)
+    return image.get_size(), pygame.image.tobytes(image, PIXEL_FORMAT)
+
+
+def bake(output: str = ASSET_PACK_PATH, jobs: int | None = None, screen_size: tuple[int, int] = SCREEN_SIZE) -> dict:
+    """
+    Bakes every entry into the pack at output. Entries whose content hash did
+    not change are copied from the existing pack instead of being decoded again.
+
+    Returns:
+        dict: Counts of baked and reused entries and the pack size in bytes.
+    """
+    entries = bake_entries(screen_size)
+    old_pack = AssetPack.open(output)
+    old_entries = old_pack.index["entries"] if old_pack is not None else {}
+
+    hashes = {key: source_hash(*key) for key in entries}
+    results = {}
+    to_bake = []
+    for key in entries:
+        old = old_entries.get(entry_key(*key))
+        if old is not None and old["hash"] == hashes[key]:
+            start = old_pack.data_start + old["offset"]
+            results[key] = (tuple(old["size"]), old_pack.mm[start:start + old["size"][0] * old["size"][1] * 4])
+        else:
+            to_bake.append(key)
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for key, result in zip(to_bake, pool.map(_bake_image, *zip(*to_bake)) if to_bake else []):
+            results[key] = result
+    if old_pack is not None:
+        old_pack.mm.close()
+        old_pack.file.close()
+
+    index = {"format": PIXEL_FORMAT, "entries": {}}
+    offset = 0
+    for key in entries:
+        size, pixels = results[key]
+        stat = os.stat(key[0])
+        index["entries"][entry_key(*key)] = {
+            "offset": offset,
+            "size": list(size),
+            "hash": hashes[key],
+            "source_size": stat.st_size,
+            "source_mtime_ns": stat.st_mtime_ns,
+        }
+        offset = _align(offset + len(pixels))
+    index_bytes = json.dumps(index).encode('utf-8')
+    data_start = _align(PACK_HEADER.size + len(index_bytes))
+
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    temp_output = output + ".tmp"
+    with open(temp_output, 'wb') as f:
+        f.write(PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(index_bytes)))
+        f.write(index_bytes)
+        for key in entries:
+            f.seek(data_start + index["entries"][entry_key(*key)]["offset"])
+            f.write(results[key][1])
+    os.replace(temp_output, output)
+
+    return {"baked": len(to_bake), "reused": len(entries) - len(to_bake), "bytes": os.path.getsize(output)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bake pre-scaled display-format images into an asset pack.")
+    parser.add_argument("--output", default=ASSET_PACK_PATH)
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: one per core)")
+    args = parser.parse_args()
+    summary = bake(args.output, args.jobs)
+    print(f"Baked {summary['baked']} images, reused {summary['reused']}, wrote {summary['bytes']} bytes to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
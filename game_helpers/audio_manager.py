@@ -0,0 +1,124 @@
+import pygame
+from game_helpers.json_loader import load_json_file
+from game_helpers.sound_with_pith import play_sound_with_pitch, sound_bank, STALE_SOUND_MS
+
+AUDIO_MANIFEST_PATH = "audio_manifest.json"
+CROSSFADE_MS = 800
+
+_manifest = None
+
+
+def get_audio_manifest() -> dict:
+    """Returns the audio manifest, reading it from disk on first use."""
+    global _manifest
+    if _manifest is None:
+        _manifest = load_json_file(AUDIO_MANIFEST_PATH)
+    return _manifest
+
+
+def ensure_mixer():
+    """Initialises the mixer on first use; fast-start mode skips it during startup."""
+    if not pygame.mixer.get_init():
+        pygame.mixer.init()
+
+
+def preload_sound_effects():
+    """Decodes every sound effect listed in the manifest so no click has to touch the disk."""
+    ensure_mixer()
+    for name in get_audio_manifest()["sound_effects"]:
+        preload_sound_effect(name)
+
+
+def preload_sound_effect(name: str):
+    """Decodes one sound effect; the mixer must already be initialised. Safe to call from a loader thread."""
+    effect = get_audio_manifest()["sound_effects"][name]
+    sound_bank.preload(effect["path"], effect.get("volume", 0.1))
+
+
+def play_effect(name: str, pitch_factor: float = 1.0, max_delay_ms: int | None = STALE_SOUND_MS):
+    """
+    Plays a sound effect from the manifest.
+
+    Args:
+        name (str): Key in the manifest's "sound_effects" section, e.g. "click".
+        pitch_factor (float): Playback speed, 1.0 is the original pitch.
+        max_delay_ms (int | None): Skip the sound if it cannot start within this time, None to never skip.
+    """
+    ensure_mixer()
+    effect = get_audio_manifest()["sound_effects"][name]
+    play_sound_with_pitch(effect["path"], pitch_factor, effect.get("category", "ui"), max_delay_ms)
+
+
+class MusicPlayer:
+    """
+    Streams background music with pygame.mixer.music and crossfades when
+    the game switches to a scene that uses a different track.
+    """
+    def __init__(self, volume_scale: float = 1.0, crossfade_ms: int = CROSSFADE_MS):
+        manifest = get_audio_manifest()
+        self.tracks = manifest["music"]
+        self.scene_music = manifest["scene_music"]
+        self.volume_scale = volume_scale
+        self.crossfade_ms = crossfade_ms
+
+        self.current_track = None
+        self.next_track = None
+        self.fade = 0.0 # 0 = silent, 1 = full track volume
+        self.fading_out = False
+
+    def play_for_scene(self, scene_state: str):
+        """Crossfades to the track configured for the scene (or the default track)."""
+        self.crossfade_to(self.scene_music.get(scene_state, self.scene_music.get("default")))
+
+    def crossfade_to(self, track_name: str | None):
+        """Fades the current track out and the new one in. None fades to silence."""
+        if track_name == (self.next_track if self.fading_out else self.current_track):
+            return
+        if self.current_track is None:
+            self._start(track_name)
+        else:
+            self.next_track = track_name
+            self.fading_out = True
+
+    def is_fading(self) -> bool:
+        return self.fading_out or (self.current_track is not None and self.fade < 1.0)
+
+    def set_volume(self, volume_scale: float):
+        self.volume_scale = volume_scale
+        self._apply_volume()
+
+    def update(self, dt: int):
+        """Advances the crossfade; dt is the frame time in milliseconds."""
+        step = dt / self.crossfade_ms if self.crossfade_ms > 0 else 1.0
+        if self.fading_out:
+            self.fade = max(0.0, self.fade - step)
+            if self.fade == 0.0:
+                self.fading_out = False
+                pygame.mixer.music.stop()
+                self.current_track = None
+                self._start(self.next_track)
+                self.next_track = None
+        elif self.current_track is not None and self.fade < 1.0:
+            self.fade = min(1.0, self.fade + step)
+        else:
+            return
+        self._apply_volume()
+
+    def _start(self, track_name: str | None):
+        if track_name is None:
+            return
+        ensure_mixer()
+        try:
+            pygame.mixer.music.load(self.tracks[track_name]["path"])
+        except pygame.error as e:
+            print(f"Could not load music {track_name}: {e}")
+            return
+        self.current_track = track_name
+        self.fade = 0.0
+        self._apply_volume()
+        pygame.mixer.music.play(-1)
+
+    def _apply_volume(self):
+        if self.current_track is not None:
+            track_volume = self.tracks[self.current_track].get("volume", 1.0)
+            pygame.mixer.music.set_volume(track_volume * self.volume_scale * self.fade)
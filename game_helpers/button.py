@@ -1,39 +1,89 @@
 import pygame
 import random
-from game_helpers.sound_with_pith import play_sound_with_pitch
+from game_helpers.audio_manager import play_effect
+from game_helpers.text_cache import get_font, render_text
+from game_helpers.dirty_rects import mark_dirty
+from game_helpers.render_queue import queue_blit
+from game_helpers.perf_counters import perf_counters
+
+DISABLED_BUTTON_COLOR = (90, 90, 90)
 
 class Button:
-    """A simple button class."""
-    def __init__(self , x, y , width, height, text :str, button_color: tuple  ,button_hover_color:tuple, text_color: tuple , font_size: int, sound_path: str = "music/sound_effects/click.wav"):
+    """
+    A simple button class.
+
+    The normal, hover and disabled looks are rendered once into surfaces and
+    reused; they are rebuilt only when the text, colors or size change.
+    """
+    def __init__(self , x, y , width, height, text :str, button_color: tuple  ,button_hover_color:tuple, text_color: tuple , font_size: int, sound_name: str = "click"):
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
         self.button_color = button_color
         self.text_color = text_color
-        self.font = pygame.font.Font("assets/fonts/pixelFont.ttf", font_size)
+        self.font = get_font(font_size)
         self.is_hovered = False
         self.button_hover_color = button_hover_color
-        self.sound_path = sound_path
+        self.sound_name = sound_name
+        self.enabled = True
+        self.drawn_state = (False, True) # (hovered, enabled) last reported to the dirty-rect tracker
+        self.rendered: dict[str, tuple[pygame.Surface, tuple[int, int]]] = {} # look -> (surface, offset from rect.topleft)
+        self.rendered_key = None
 
 
     def draw(self, screen:pygame.Surface):
         if hasattr(self, "image") and self.image is not None:
-            screen.blit(self.image, self.rect)
-        elif self.button_color is not None:
-            # Choose color based on hover state
-            color = self.button_hover_color if self.is_hovered else self.button_color
-            pygame.draw.rect(screen, color, self.rect, border_radius=5)
-        # Draw text if needed
-        if self.text:
-            text_surface = self.font.render(self.text, True, self.text_color)
-            text_rect = text_surface.get_rect(center=self.rect.center)
-            screen.blit(text_surface, text_rect)
+            queue_blit(screen, self.image, self.rect.topleft)
+            # Draw text if needed
+            if self.text:
+                text_surface = render_text(self.font, self.text, self.text_color)
+                queue_blit(screen, text_surface, text_surface.get_rect(center=self.rect.center))
+            return
+
+        # Choose the look based on hover state
+        if not self.enabled:
+            look = "disabled"
+        else:
+            look = "hover" if self.is_hovered else "normal"
+        surface, offset = self.get_rendered(look)
+        queue_blit(screen, surface, (self.rect.x + offset[0], self.rect.y + offset[1]))
+
+    def get_rendered(self, look: str) -> tuple[pygame.Surface, tuple[int, int]]:
+        """Returns the pre-rendered surface for a look and its offset from rect.topleft."""
+        key = (self.text, self.button_color, self.button_hover_color, self.text_color, self.rect.size, self.font)
+        if key != self.rendered_key:
+            self.rendered.clear()
+            self.rendered_key = key
+        rendered = self.rendered.get(look)
+        if rendered is None:
+            rendered = self.render_look(look)
+            self.rendered[look] = rendered
+        return rendered
+
+    def render_look(self, look: str) -> tuple[pygame.Surface, tuple[int, int]]:
+        color = {"normal": self.button_color, "hover": self.button_hover_color, "disabled": DISABLED_BUTTON_COLOR}[look]
+        button_rect = pygame.Rect((0, 0), self.rect.size)
+        text_surface = render_text(self.font, self.text, self.text_color) if self.text else None
+        # Labels wider than the button overflow it, like they did when drawn straight to the screen
+        bounds = button_rect.union(text_surface.get_rect(center=button_rect.center)) if text_surface else button_rect
+        surface = pygame.Surface(bounds.size, pygame.SRCALPHA).convert_alpha()
+        perf_counters.incr("surfaces")
+        surface.fill((0, 0, 0, 0))
+        button_rect.move_ip(-bounds.x, -bounds.y)
+        if self.button_color is not None:
+            pygame.draw.rect(surface, color, button_rect, border_radius=5)
+        if text_surface:
+            surface.blit(text_surface, text_surface.get_rect(center=button_rect.center))
+        return surface, bounds.topleft
 
     def update(self,dt:int):
-        pass
+        state = (self.is_hovered, self.enabled)
+        if state != self.drawn_state:
+            mark_dirty(self.rect)
+            self.drawn_state = state
     def is_clicked(self, mouse_pos: tuple) -> bool:
         """Check if the button is clicked."""
-        clicked= self.rect.collidepoint(mouse_pos)
+        clicked= self.enabled and self.rect.collidepoint(mouse_pos)
         return clicked
 
     def play_click_sound(self):
-        play_sound_with_pitch(self.sound_path, pitch_factor=1.0 + random.uniform(-0.2, 0.2))
\ No newline at end of file
+        play_effect(self.sound_name, pitch_factor=1.0 + random.uniform(-0.2, 0.2))
\ No newline at end of file
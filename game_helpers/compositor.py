@@ -0,0 +1,147 @@
+import pygame
+from game_helpers.layers import (LAYER_BACKGROUND, LAYER_BOARD, LAYER_HAND, LAYER_UI, LAYER_OVERLAY, LAYER_DRAG,
+                                 LAYER_ORDER)
+from game_helpers.render_queue import render_queue, queue_blits
+from game_helpers.perf_counters import perf_counters
+
+STATIC = "static" # rendered once, until invalidated
+CACHED = "cached" # re-rendered when its signature changes
+DYNAMIC = "dynamic" # drawn straight to the screen every frame
+REGION_SIZE = 64 # translucent layers are blitted in tiles of this size, skipping empty ones (needs NumPy)
+
+
+class Layer:
+    """One layer of a Compositor: a list of draw callbacks and, unless dynamic, the surface they were rendered to."""
+    def __init__(self, name: str, mode: str = DYNAMIC, opaque: bool = False):
+        self.name = name
+        self.mode = mode
+        self.opaque = opaque
+        self.drawers = [] # (draw(surface), signature() or None)
+        self.surface = None
+        self.regions = [] # (surface, position, area) blits covering the parts of surface that have content
+        self.signature = None
+        self.renders = 0
+
+    def current_signature(self) -> tuple:
+        return tuple(signature() if signature is not None else None for _, signature in self.drawers)
+
+    def render(self, size: tuple[int, int]):
+        if self.surface is None or self.surface.get_size() != tuple(size):
+            if self.opaque:
+                self.surface = pygame.Surface(size).convert()
+            else:
+                self.surface = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            perf_counters.incr("surfaces")
+        self.surface.fill((0, 0, 0, 0))
+        for draw, _ in self.drawers:
+            draw(self.surface)
+        self.regions = [(self.surface, area.topleft, area) for area in self.content_areas()]
+        self.renders += 1
+
+    def content_areas(self) -> list[pygame.Rect]:
+        """Rects covering every non-transparent pixel: whole REGION_SIZE tiles, joined along each row."""
+        if self.opaque:
+            return [self.surface.get_rect()]
+        import numpy as np
+        import pygame.surfarray # imported on first use, fast start keeps it out of the pygame import
+        width, height = self.surface.get_size()
+        columns, rows = -(-width // REGION_SIZE), -(-height // REGION_SIZE)
+        # Cleared pixels are all zero, so any set bit marks content. Rows are contiguous in memory, so
+        # reducing rows first and then columns is several times faster than one reduction over both.
+        pixels = pygame.surfarray.pixels2d(self.surface).T
+        if (columns * REGION_SIZE, rows * REGION_SIZE) != (width, height):
+            padded = np.zeros((rows * REGION_SIZE, columns * REGION_SIZE), pixels.dtype)
+            padded[:height, :width] = pixels
+            pixels = padded
+        used = pixels.reshape(rows, REGION_SIZE, -1).max(axis=1).reshape(rows, columns, REGION_SIZE).max(axis=2) > 0
+        del pixels # releases the surface lock
+        areas = []
+        for row in range(rows):
+            column = 0
+            while column < columns:
+                if not used[row, column]:
+                    column += 1
+                    continue
+                start = column
+                while column < columns and used[row, column]:
+                    column += 1
+                area = pygame.Rect(start * REGION_SIZE, row * REGION_SIZE, (column - start) * REGION_SIZE, REGION_SIZE)
+                areas.append(area.clip(self.surface.get_rect()))
+        return areas
+
+    def draw(self, screen: pygame.Surface):
+        if not self.drawers:
+            return
+        if self.mode == DYNAMIC:
+            for draw, _ in self.drawers:
+                draw(screen)
+            return
+        if self.mode == CACHED:
+            signature = self.current_signature()
+            if signature != self.signature or self.surface is None:
+                self.render(screen.get_size())
+                self.signature = signature
+        elif self.surface is None:
+            self.render(screen.get_size())
+        queue_blits(screen, self.regions)
+
+    def invalidate(self):
+        self.signature = None
+        if self.mode == STATIC:
+            self.surface = None
+
+
+class Compositor:
+    """
+    Draws a scene as a fixed stack of layers (background, board, hand, ui,
+    overlay, drag). Static and cached layers keep a pre-rendered surface,
+    so a frame is a handful of layer blits plus whatever is truly dynamic.
+    Dynamic layers draw through game_helpers.render_queue.
+    """
+    def __init__(self):
+        self.layers = {name: Layer(name) for name in LAYER_ORDER}
+
+    def set_mode(self, layer: str, mode: str, opaque: bool = False):
+        """
+        Args:
+            layer (str): One of LAYER_ORDER.
+            mode (str): STATIC, CACHED or DYNAMIC.
+            opaque (bool): The layer covers the whole screen, so it is kept without per-pixel alpha.
+        """
+        self.layers[layer].mode = mode
+        self.layers[layer].opaque = opaque
+        self.layers[layer].invalidate()
+
+    def add(self, layer: str, draw, signature=None):
+        """
+        Adds a draw callback to a layer.
+
+        Args:
+            draw (callable): Called with the surface to draw on.
+            signature (callable): For cached layers, returns a hashable value that changes whenever
+                the callback would draw something different.
+        """
+        self.layers[layer].drawers.append((draw, signature))
+        self.layers[layer].invalidate()
+
+    def invalidate(self, layer: str = None):
+        """Forces one layer (or every layer) to be rendered again on the next draw."""
+        for name in (layer,) if layer is not None else LAYER_ORDER:
+            self.layers[name].invalidate()
+
+    def draw(self, screen: pygame.Surface):
+        """
+        Draws every layer through the render queue, which flushes them with one blits call per layer.
+        Joins the frame if one is already open for screen, otherwise opens and flushes its own.
+        """
+        owns_frame = render_queue.target is not screen
+        if owns_frame:
+            render_queue.begin(screen)
+        for name in LAYER_ORDER:
+            render_queue.layer = name
+            self.layers[name].draw(screen)
+        if owns_frame:
+            render_queue.flush()
+
+    def stats(self) -> dict:
+        return {name: {"mode": layer.mode, "renders": layer.renders} for name, layer in self.layers.items()}
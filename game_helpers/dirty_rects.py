@@ -0,0 +1,119 @@
+import os
+import pygame
+from game_helpers.text_cache import render_text
+
+MAX_DIRTY_RECTS = 32 # more rects than this in one frame and the whole screen is redrawn instead
+FULL_REDRAW_RATIO = 0.6 # same when the dirty area covers this share of the screen
+DEBUG_RECT_COLOR = (255, 0, 80)
+DEBUG_TEXT_COLOR = (255, 255, 0)
+
+
+class DirtyRects:
+    """
+    Collects the screen regions that changed since the last presented frame.
+
+    Drawables call mark() with their old and new rects whenever something
+    about them changes (position, hover state, animation frame). In dirty-rect
+    mode the game redraws only those regions and pushes them with
+    pygame.display.update(rects) instead of flipping the whole screen.
+    Scenes opt in with a supports_dirty_rects attribute; every other scene
+    is drawn and flipped in full.
+    """
+    def __init__(self):
+        self.enabled = os.environ.get("PLANTBAY_DIRTY_RECTS") == "1"
+        self.debug = False
+        self.rects: list[pygame.Rect] = []
+        self.full_redraw = True
+        self.debug_rects: list[pygame.Rect] = [] # outlined last frame, restored this frame
+
+        self.frames = 0
+        self.full_frames = 0
+        self.skipped_frames = 0
+        self.last_pixels = 0
+        self.pushed_pixels = 0
+
+    def mark(self, rect):
+        """Marks a screen region as changed. Does nothing unless dirty-rect mode is on."""
+        if self.enabled and rect is not None:
+            self.rects.append(pygame.Rect(rect))
+
+    def mark_all(self):
+        """Forces the next frame to be drawn in full, e.g. after a scene change."""
+        self.full_redraw = True
+
+    def take(self, screen_rect: pygame.Rect) -> list[pygame.Rect] | None:
+        """
+        Returns the merged regions to redraw this frame and resets the list.
+        None means the whole screen; an empty list means nothing changed.
+        """
+        rects = [rect.clip(screen_rect) for rect in self.rects + self.debug_rects]
+        self.rects.clear()
+        self.debug_rects = []
+        if self.full_redraw:
+            self.full_redraw = False
+            return None
+
+        merged: list[pygame.Rect] = []
+        for rect in rects:
+            if rect.width <= 0 or rect.height <= 0:
+                continue
+            # Fold the rect into any it overlaps until it overlaps nothing
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect = rect.union(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+
+        area = sum(rect.width * rect.height for rect in merged)
+        if len(merged) > MAX_DIRTY_RECTS or area > screen_rect.width * screen_rect.height * FULL_REDRAW_RATIO:
+            return None
+        return merged
+
+    def record(self, rects: list[pygame.Rect] | None, screen_rect: pygame.Rect):
+        """Counts the pixels pushed to the display for one frame."""
+        self.frames += 1
+        if rects is None:
+            self.full_frames += 1
+            self.last_pixels = screen_rect.width * screen_rect.height
+        else:
+            if not rects:
+                self.skipped_frames += 1
+            self.last_pixels = sum(rect.width * rect.height for rect in rects)
+        self.pushed_pixels += self.last_pixels
+
+    def draw_debug(self, screen: pygame.Surface, rects: list[pygame.Rect] | None, font: pygame.font.Font) -> list[pygame.Rect]:
+        """
+        Outlines this frame's dirty regions and prints the pixels pushed.
+        The outlined regions are restored on the next frame.
+
+        Returns:
+            list[pygame.Rect]: Extra regions the overlay drew on, to push with this frame.
+        """
+        screen_rect = screen.get_rect()
+        for rect in rects or ():
+            pygame.draw.rect(screen, DEBUG_RECT_COLOR, rect, 1)
+        share = self.last_pixels / (screen_rect.width * screen_rect.height)
+        label = "full frame" if rects is None else f"{len(rects)} rects"
+        text = render_text(font, f"{label}, {self.last_pixels} px ({share:.0%})", DEBUG_TEXT_COLOR)
+        text_rect = text.get_rect(bottomleft=(4, screen_rect.height - 4))
+        screen.fill((0, 0, 0), text_rect)
+        screen.blit(text, text_rect)
+        self.debug_rects = list(rects or ()) + [text_rect]
+        return [text_rect]
+
+    def stats(self) -> dict:
+        return {
+            "frames": self.frames,
+            "full_frames": self.full_frames,
+            "skipped_frames": self.skipped_frames,
+            "pushed_pixels": self.pushed_pixels,
+            "average_pixels": self.pushed_pixels / self.frames if self.frames else 0,
+        }
+
+
+dirty_rects = DirtyRects()
+
+
+def mark_dirty(rect):
+    """Marks a screen region as changed, see DirtyRects.mark."""
+    dirty_rects.mark(rect)
@@ -0,0 +1,23 @@
+import sys
+
+# Optional modules pygame imports eagerly: numpy (through surfarray/sndarray) and
+# pkg_resources (through pkgdata). pygame falls back gracefully when they are missing.
+DEFERRED_MODULES = ("numpy", "pkg_resources")
+
+
+def import_pygame_deferred(deferred: tuple = DEFERRED_MODULES):
+    """
+    Imports pygame with the deferred modules hidden, so they are only imported
+    on first real use (e.g. `import pygame.sndarray` when a sound is resampled).
+    Must run before anything else imports pygame.
+    """
+    hidden = [name for name in deferred if name not in sys.modules]
+    for name in hidden:
+        sys.modules[name] = None # makes `import name` raise ImportError
+    try:
+        import pygame
+    finally:
+        for name in hidden:
+            if sys.modules.get(name) is None:
+                del sys.modules[name]
+    return pygame
@@ -0,0 +1,116 @@
+from collections import OrderedDict
+import pygame
+from game_helpers.perf_counters import perf_counters
+
+SCALE_STEP = 0.02 # animated scales are rounded to this step so easing animations reuse frames
+FRAME_CACHE_SIZE = 256 # scaled frames and overlays kept before the least recently used is dropped
+
+
+class FrameCache:
+    """
+    LRU cache of derived animation frames: scaled copies of a surface,
+    quantized to SCALE_STEP, and flat translucent tint overlays. Lets
+    pulsing or easing objects blit a cached frame instead of scaling or
+    allocating a surface on every frame.
+    """
+    def __init__(self, max_entries: int = FRAME_CACHE_SIZE, scale_step: float = SCALE_STEP):
+        self.max_entries = max_entries
+        self.scale_step = scale_step
+        self.frames: OrderedDict = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def scale_bucket(self, scale: float) -> int:
+        return max(1, round(scale / self.scale_step))
+
+    def scaled(self, image: pygame.Surface, scale: float, rotozoom: bool = True) -> pygame.Surface:
+        """
+        Returns image scaled by (roughly) scale.
+
+        Args:
+            image (pygame.Surface): Source frame. Cached per surface object, so pass shared surfaces.
+            scale (float): Scale factor, rounded to the cache's scale step. A step of 1.0 returns image itself.
+            rotozoom (bool): Filter with transform.rotozoom (smooth) instead of transform.scale.
+        """
+        bucket = self.scale_bucket(scale)
+        if bucket * self.scale_step == 1.0:
+            return image
+        key = ("scaled", image, bucket, rotozoom)
+        frame = self._get(key)
+        if frame is None:
+            factor = bucket * self.scale_step
+            if rotozoom:
+                frame = pygame.transform.rotozoom(image, 0, factor)
+            else:
+                frame = pygame.transform.scale(image, (int(image.get_width() * factor), int(image.get_height() * factor)))
+            self._put(key, frame)
+            perf_counters.incr("surfaces")
+        return frame
+
+    def overlay(self, size: tuple[int, int], color: tuple, alpha: int) -> pygame.Surface:
+        """Returns a surface of the given size filled with color at alpha, e.g. an upgrade tint."""
+        key = ("overlay", tuple(size), tuple(color[:3]), alpha)
+        frame = self._get(key)
+        if frame is None:
+            frame = pygame.Surface(size, pygame.SRCALPHA)
+            frame.fill((*color[:3], alpha))
+            perf_counters.incr("surfaces")
+            self._put(key, frame)
+        return frame
+
+    def panel(self, size: tuple[int, int], color: tuple, border_color: tuple, border_width: int, radius: int) -> pygame.Surface:
+        """Returns a rounded rectangle with a border, e.g. a popup background, so it can be blitted like an image."""
+        key = ("panel", tuple(size), tuple(color), tuple(border_color), border_width, radius)
+        frame = self._get(key)
+        if frame is None:
+            frame = pygame.Surface(size, pygame.SRCALPHA)
+            frame.fill((0, 0, 0, 0))
+            pygame.draw.rect(frame, color, frame.get_rect(), border_radius=radius)
+            pygame.draw.rect(frame, border_color, frame.get_rect(), border_width, border_radius=radius)
+            perf_counters.incr("surfaces")
+            self._put(key, frame)
+        return frame
+
+    def _get(self, key):
+        frame = self.frames.get(key)
+        if frame is not None:
+            self.frames.move_to_end(key)
+            self.hits += 1
+        return frame
+
+    def _put(self, key, frame: pygame.Surface):
+        self.misses += 1
+        self.frames[key] = frame
+        if len(self.frames) > self.max_entries:
+            self.frames.popitem(last=False)
+
+    def clear(self):
+        self.frames.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self.frames),
+        }
+
+
+frame_cache = FrameCache()
+
+
+def scaled_frame(image: pygame.Surface, scale: float, rotozoom: bool = True) -> pygame.Surface:
+    """Returns a cached scaled copy of image, see FrameCache.scaled."""
+    return frame_cache.scaled(image, scale, rotozoom)
+
+
+def tint_overlay(size: tuple[int, int], color: tuple, alpha: int) -> pygame.Surface:
+    """Returns a cached translucent overlay, see FrameCache.overlay."""
+    return frame_cache.overlay(size, color, alpha)
+
+
+def panel_frame(size: tuple[int, int], color: tuple, border_color: tuple, border_width: int = 3, radius: int = 10) -> pygame.Surface:
+    """Returns a cached bordered rounded rectangle, see FrameCache.panel."""
+    return frame_cache.panel(size, color, border_color, border_width, radius)
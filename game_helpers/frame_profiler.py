@@ -0,0 +1,181 @@
+import csv
+import os
+import time
+import pygame
+from game_helpers.perf_counters import perf_counters
+
+PROFILE_FRAMES = 600 # frames kept in the ring buffer (10 s at 60 FPS)
+PHASES = ("events", "update", "draw", "present", "loader", "wait")
+WORK_PHASES = PHASES[:-1] # "wait" is time spent sleeping in clock.tick, not work
+PROFILE_CSV_PATH = "frame_profile.csv"
+FRAME_BUDGET_MS = 1000 / 60
+
+HUD_SIZE = (260, 144)
+HUD_GRAPH_HEIGHT = 60
+HUD_GRAPH_MAX_MS = 50 # frame times above this are clipped in the graph
+HUD_TEXT_INTERVAL = 10 # frames between refreshes of the HUD text
+HUD_BACKGROUND = (0, 0, 0, 180)
+HUD_TEXT_COLOR = (255, 255, 255)
+HUD_BAR_COLOR = (80, 200, 80)
+HUD_SLOW_BAR_COLOR = (230, 60, 60)
+HUD_BUDGET_COLOR = (255, 255, 0)
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """Nearest-rank percentile of values, 0.0 when there are none."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, -(-len(ordered) * percent // 100) - 1))
+    return ordered[int(index)]
+
+
+class FrameProfiler:
+    """
+    Times each phase of the game loop (events, update, draw, present, loader
+    work and the wait in clock.tick) with time.perf_counter, per frame and
+    per scene. The last PROFILE_FRAMES frames are kept in a ring buffer.
+
+    F3 toggles a HUD with the frame-time graph, p50/p95/p99 and the slowest
+    phase; F4 writes the history to PROFILE_CSV_PATH for bug reports.
+    """
+    def __init__(self, max_frames: int = PROFILE_FRAMES):
+        self.enabled = os.environ.get("PLANTBAY_FRAME_PROFILE", "1") != "0"
+        self.show_hud = False
+        self.max_frames = max_frames
+        self.history: list[tuple | None] = [None] * max_frames # (frame, scene, total ms, *phase ms)
+        self.next_index = 0
+        self.count = 0
+        self.frame = 0
+
+        self.scene = None
+        self.phase_ms = dict.fromkeys(PHASES, 0.0)
+        self.frame_start = None
+        self.last_lap = None
+
+        self.hud_surface = None
+        self.hud_text: list[pygame.Surface] = []
+
+    def reset(self):
+        """Forgets the recorded history, e.g. between benchmark runs."""
+        self.history = [None] * self.max_frames
+        self.next_index = 0
+        self.count = 0
+
+    def begin_frame(self, scene: str):
+        """Starts timing a frame of the given scene."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.scene = scene
+        self.frame_start = self.last_lap = now
+        for phase in PHASES:
+            self.phase_ms[phase] = 0.0
+
+    def lap(self, phase: str):
+        """Adds the time since the previous lap (or the frame start) to a phase."""
+        if self.last_lap is None:
+            return
+        now = time.perf_counter()
+        self.phase_ms[phase] += (now - self.last_lap) * 1000
+        self.last_lap = now
+
+    def end_frame(self):
+        """Stores the finished frame in the ring buffer."""
+        if self.frame_start is None:
+            return
+        total = (time.perf_counter() - self.frame_start) * 1000
+        self.history[self.next_index] = (self.frame, self.scene, total, *(self.phase_ms[phase] for phase in PHASES))
+        self.next_index = (self.next_index + 1) % self.max_frames
+        self.count = min(self.count + 1, self.max_frames)
+        self.frame += 1
+        self.frame_start = self.last_lap = None
+
+    def frames(self) -> list[tuple]:
+        """Recorded frames, oldest first."""
+        if self.count < self.max_frames:
+            return self.history[:self.count]
+        return self.history[self.next_index:] + self.history[:self.next_index]
+
+    def summary(self, scene: str = None) -> dict:
+        """
+        Frame-time percentiles and mean phase times over the history.
+
+        Args:
+            scene (str): Only count frames of this scene.
+        """
+        frames = [frame for frame in self.frames() if scene is None or frame[1] == scene]
+        totals = [frame[2] for frame in frames]
+        phases = {phase: sum(frame[3 + index] for frame in frames) / len(frames) if frames else 0.0
+                  for index, phase in enumerate(PHASES)}
+        return {
+            "frames": len(frames),
+            "p50": percentile(totals, 50),
+            "p95": percentile(totals, 95),
+            "p99": percentile(totals, 99),
+            "max": max(totals, default=0.0),
+            "phases": phases,
+            "slowest_phase": max(WORK_PHASES, key=phases.get),
+        }
+
+    def scene_summaries(self) -> dict:
+        return {scene: self.summary(scene) for scene in {frame[1] for frame in self.frames()}}
+
+    def export_csv(self, path: str = PROFILE_CSV_PATH) -> str:
+        """Writes the history, one row per frame with the time of every phase in ms."""
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", "scene", "total_ms", *(f"{phase}_ms" for phase in PHASES)])
+            for frame in self.frames():
+                writer.writerow([frame[0], frame[1], *(f"{value:.3f}" for value in frame[2:])])
+        print(f"Frame profile of {self.count} frames written to {path}")
+        return path
+
+    def hud_rect(self, screen_rect: pygame.Rect) -> pygame.Rect:
+        return pygame.Rect((screen_rect.right - HUD_SIZE[0] - 4, 4), HUD_SIZE)
+
+    def draw_hud(self, screen: pygame.Surface, font: pygame.font.Font) -> pygame.Rect:
+        """Draws the HUD in the top-right corner and returns its rect."""
+        if self.hud_surface is None:
+            self.hud_surface = pygame.Surface(HUD_SIZE, pygame.SRCALPHA)
+        surface = self.hud_surface
+        surface.fill(HUD_BACKGROUND)
+
+        # The numbers change every frame, so they are rendered directly instead of through the text cache
+        if not self.hud_text or self.frame % HUD_TEXT_INTERVAL == 0:
+            summary = self.summary()
+            scene = self.summary(self.scene)
+            self.hud_text = [
+                font.render(f"p50 {summary['p50']:.1f}  p95 {summary['p95']:.1f}  p99 {summary['p99']:.1f} ms",
+                            True, HUD_TEXT_COLOR),
+                font.render(f"slowest: {summary['slowest_phase']} {summary['phases'][summary['slowest_phase']]:.2f} ms",
+                            True, HUD_TEXT_COLOR),
+                font.render(f"{self.scene}: p95 {scene['p95']:.1f} ms", True, HUD_TEXT_COLOR),
+            ]
+            if perf_counters.enabled:
+                counts = perf_counters.last_frame
+                self.hud_text.append(font.render(
+                    f"blits {counts['blits']}  surf {counts['surfaces']}  text {counts['font_renders']}  "
+                    f"load {counts['image_loads'] + counts['sound_loads']}", True, HUD_TEXT_COLOR))
+        y = 2
+        for text in self.hud_text:
+            surface.blit(text, (4, y))
+            y += text.get_height()
+
+        # One bar per frame, newest on the right
+        graph_bottom = HUD_SIZE[1] - 2
+        scale = HUD_GRAPH_HEIGHT / HUD_GRAPH_MAX_MS
+        frames = self.frames()[-(HUD_SIZE[0] - 8):]
+        x = HUD_SIZE[0] - 4 - len(frames)
+        for frame in frames:
+            height = min(HUD_GRAPH_HEIGHT, frame[2] * scale)
+            color = HUD_SLOW_BAR_COLOR if frame[2] > FRAME_BUDGET_MS * 1.5 else HUD_BAR_COLOR
+            pygame.draw.line(surface, color, (x, graph_bottom), (x, graph_bottom - height))
+            x += 1
+        budget_y = graph_bottom - FRAME_BUDGET_MS * scale
+        pygame.draw.line(surface, HUD_BUDGET_COLOR, (4, budget_y), (HUD_SIZE[0] - 4, budget_y))
+
+        return screen.blit(surface, self.hud_rect(screen.get_rect()))
+
+
+frame_profiler = FrameProfiler()
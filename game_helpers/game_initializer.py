@@ -23,14 +23,14 @@ class GameInitializer:
             soil = Soil(x, plot_y, SOIL_SIZE, "assets/soils/soil.png", SOIL_DEFAULT_COLOR)
             self.game_manager.soils.append(soil)
 
-    def initialize_ui_elements(self):
+    def initialize_ui_elements(self, playing_scene):
         """Initializes UI elements like the 'Play Hand' button."""
         button_width = 150
         button_height = 50
         button_x = self.game_manager.screen.get_width() - button_width - 22
         button_y = self.game_manager.screen.get_height() // 2 - button_height // 2
 
-        self.game_manager.playing_scene.play_hand_button = Button(
+        playing_scene.play_hand_button = Button(
             button_x, button_y, button_width, button_height,
             "Play Hand", (50,150,50), (0, 150, 0),(255,255,255), 24
         )
\ No newline at end of file
@@ -3,7 +3,7 @@ import pygame
 from game_objects.seed import Seed
 from game_objects.soil_upgrade import SoilUpgrade
 import random
-from game_helpers.sound_with_pith import play_sound_with_pitch
+from game_helpers.audio_manager import play_effect
 
 # Constants used in game logic
 DEFAULT_SEED_VALUE = 10
@@ -155,7 +155,7 @@ class GameRoundManager:
 
             self.pending_state_change = self.game_manager.GAME_STATE_ROUND_WON
             self.pending_state_change_time = pygame.time.get_ticks() + 300
-            play_sound_with_pitch('music/sound_effects/round-won.wav', 1.0)
+            play_effect('round-won', 1.0, max_delay_ms=None)
         else:
             self.start_new_round()
         if (
@@ -197,7 +197,7 @@ class GameRoundManager:
                         soil.target_scale = 1.2
                         soil.start_shaking(duration=400, intensity=10)
                         soil.spawn_particles(20, (255, 215, 0, 180))
-                        play_sound_with_pitch("music/sound_effects/harvest.wav", pitch_factor=1.0 +self.pith_value)
+                        play_effect("harvest", pitch_factor=1.0 +self.pith_value)
                         soil.target_scale = 1.0
                         self.pith_value += 0.1
 
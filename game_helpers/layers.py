@@ -0,0 +1,8 @@
+# Draw layers, bottom to top. Shared by the compositor and the render queue.
+LAYER_BACKGROUND = "background"
+LAYER_BOARD = "board" # soils and effects on them
+LAYER_HAND = "hand" # seeds in hand, shop products
+LAYER_UI = "ui"
+LAYER_OVERLAY = "overlay" # tooltips
+LAYER_DRAG = "drag"
+LAYER_ORDER = (LAYER_BACKGROUND, LAYER_BOARD, LAYER_HAND, LAYER_UI, LAYER_OVERLAY, LAYER_DRAG)
@@ -0,0 +1,80 @@
+import os
+
+COUNTERS = (
+    "blits", # blits queued onto the frame being drawn, see render_queue.queue_blit
+    "surfaces", # pygame.Surface allocations, including scaled copies
+    "font_renders", # font.render calls
+    "fonts", # pygame.font.Font objects created
+    "image_loads", # pygame.image.load calls
+    "sound_loads", # pygame.mixer.Sound created from a file
+    "resamples", # pitch variants resampled
+)
+
+
+class PerfCounters:
+    """
+    Counts hot-path work (blits, Surface allocations, font renders, disk
+    loads, resamples) per frame and per scene.
+
+    Call sites use perf_counters.incr(name). While counting is disabled incr
+    is bound to a function that does nothing, so an instrumented call site
+    costs one call. Enable with --perf-counters or PLANTBAY_PERF_COUNTERS=1;
+    the frame profiler HUD (F3) then shows the last frame's counts.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.incr = self._ignore
+        self.counts = dict.fromkeys(COUNTERS, 0) # current frame
+        self.last_frame = dict.fromkeys(COUNTERS, 0)
+        self.scenes: dict[str, dict[str, int]] = {} # scene -> {"frames": n, counter: total}
+        if os.environ.get("PLANTBAY_PERF_COUNTERS") == "1":
+            self.enable()
+
+    def enable(self):
+        self.enabled = True
+        self.incr = self._count
+
+    def disable(self):
+        self.enabled = False
+        self.incr = self._ignore
+
+    def reset(self):
+        self.counts = dict.fromkeys(COUNTERS, 0)
+        self.last_frame = dict.fromkeys(COUNTERS, 0)
+        self.scenes.clear()
+
+    def _count(self, name: str, amount: int = 1):
+        self.counts[name] += amount
+
+    @staticmethod
+    def _ignore(name: str, amount: int = 1):
+        pass
+
+    def end_frame(self, scene: str):
+        """Closes the current frame and adds its counts to the scene's totals."""
+        if not self.enabled:
+            return
+        totals = self.scenes.get(scene)
+        if totals is None:
+            totals = self.scenes[scene] = dict.fromkeys(("frames",) + COUNTERS, 0)
+        totals["frames"] += 1
+        for name, value in self.counts.items():
+            totals[name] += value
+        self.last_frame = self.counts
+        self.counts = dict.fromkeys(COUNTERS, 0)
+
+    def per_frame(self, scene: str) -> dict[str, float]:
+        """Average counts per frame of a scene."""
+        totals = self.scenes.get(scene)
+        if not totals:
+            return dict.fromkeys(COUNTERS, 0.0)
+        return {name: totals[name] / totals["frames"] for name in COUNTERS}
+
+    def stats(self) -> dict:
+        return {
+            "last_frame": dict(self.last_frame),
+            "per_scene": {scene: self.per_frame(scene) for scene in self.scenes},
+        }
+
+
+perf_counters = PerfCounters()
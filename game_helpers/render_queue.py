@@ -0,0 +1,106 @@
+import pygame
+from game_helpers.layers import LAYER_ORDER
+from game_helpers.perf_counters import perf_counters
+
+STATS_FRAMES = 120 # frames averaged by RenderQueue.stats
+
+
+class RenderQueue:
+    """
+    Collects the blits of one frame and draws them layer by layer.
+
+    While a frame is open for a target surface, queue_blit() calls aimed at
+    that surface are stored as (surface, position, area) entries under their
+    layer instead of being drawn. flush() then draws the layers in
+    LAYER_ORDER, each with a single Surface.blits call, so the Python
+    overhead of drawing stays flat as more soils and seeds are on screen.
+    Blits to any other surface (e.g. while a cached layer is rendered) are
+    drawn immediately.
+    """
+    def __init__(self, stats_frames: int = STATS_FRAMES):
+        self.target = None
+        self.layer = LAYER_ORDER[0] # layer used when a submission does not name one
+        self.entries = {name: [] for name in LAYER_ORDER}
+
+        self.stats_frames = stats_frames
+        self.frame_counts = [] # per-frame {layer: submissions}, newest last
+        self.frames = 0
+
+    def begin(self, target: pygame.Surface):
+        """Starts collecting the blits aimed at target."""
+        if self.target is not None:
+            self.flush()
+        self.target = target
+
+    def submit(self, surface: pygame.Surface, position, layer: str = None, area: pygame.Rect = None):
+        """
+        Queues one blit for the open frame.
+
+        Args:
+            position: Top-left corner or rect, like Surface.blit's dest.
+            layer (str): One of LAYER_ORDER; defaults to the layer being drawn.
+            area (pygame.Rect): Part of surface to draw, all of it when None.
+        """
+        entries = self.entries[layer or self.layer]
+        entries.append((surface, position) if area is None else (surface, position, area))
+
+    def submit_many(self, entries, layer: str = None):
+        """Queues a sequence of (surface, position) or (surface, position, area) blits."""
+        self.entries[layer or self.layer].extend(entries)
+
+    def flush(self):
+        """Draws everything queued on the target, one Surface.blits call per non-empty layer, and closes the frame."""
+        target = self.target
+        counts = {}
+        for name in LAYER_ORDER:
+            entries = self.entries[name]
+            if entries:
+                if target is not None:
+                    target.blits(entries, doreturn=False)
+                counts[name] = len(entries)
+                entries.clear()
+        self.target = None
+        self.layer = LAYER_ORDER[0]
+
+        self.frames += 1
+        self.frame_counts.append(counts)
+        if len(self.frame_counts) > self.stats_frames:
+            del self.frame_counts[0]
+
+    def stats(self) -> dict:
+        """Submissions and blits calls of the last frame, and submissions averaged over recent frames."""
+        last = self.frame_counts[-1] if self.frame_counts else {}
+        recent = len(self.frame_counts)
+        return {
+            "frames": self.frames,
+            "submissions": sum(last.values()),
+            "blits_calls": len(last),
+            "per_layer": dict(last),
+            "average_submissions": sum(sum(counts.values()) for counts in self.frame_counts) / recent if recent else 0.0,
+        }
+
+
+render_queue = RenderQueue()
+
+
+def queue_blit(target: pygame.Surface, surface: pygame.Surface, position, layer: str = None, area: pygame.Rect = None):
+    """
+    Blits surface onto target, through the render queue when a frame is open for target.
+
+    Args:
+        layer (str): Layer the blit belongs to, see RenderQueue.submit.
+    """
+    if target is render_queue.target:
+        perf_counters.incr("blits")
+        render_queue.submit(surface, position, layer, area)
+    else:
+        target.blit(surface, position, area)
+
+
+def queue_blits(target: pygame.Surface, entries, layer: str = None):
+    """Like queue_blit for a sequence of (surface, position) or (surface, position, area) blits."""
+    if target is render_queue.target:
+        perf_counters.incr("blits", len(entries))
+        render_queue.submit_many(entries, layer)
+    else:
+        target.blits(entries, doreturn=False)
@@ -0,0 +1,154 @@
+import os
+# The dummy drivers must be chosen before pygame is imported, so the benchmark runs without a display or sound card
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1") # keeps stdout valid JSON
+import argparse
+import json
+import platform
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCHMARK_FRAMES = 300
+WARMUP_FRAMES = 30 # frames drawn before measuring, so lazily built scenes and caches are ready
+PARTICLE_INTERVAL = 10 # frames between particle bursts on the playing board
+PARTICLE_COLOR = (255, 215, 0, 180)
+SCENES = ("STARTING SCREEN", "PLAYING", "SHOP", "INVENTORY", "ROUND WON", "OPTIONS")
+
+
+def fill_board(game):
+    """Plants a seed in every soil, the way a dropped seed is planted."""
+    from game_objects.seed import Seed
+    from game_helpers.json_loader import load_json_file
+    seed_data = load_json_file('seed_list.json')
+    names = list(seed_data)
+    for index, soil in enumerate(game.soils):
+        if not soil.is_planted:
+            soil.plant_seed(Seed.load_seed(seed_data[names[index % len(names)]]))
+            soil.set_image('assets/soils/planted_soil.png')
+    game.round_manager.calculate_predicted_score()
+
+
+def fill_backpack(game):
+    """Fills the backpack up to its capacity with every kind of seed and upgrade."""
+    from game_objects.seed import Seed
+    from game_objects.soil_upgrade import SoilUpgrade
+    from game_helpers.json_loader import load_json_file
+    player = game.player
+    seed_data = list(load_json_file('seed_list.json').values())
+    upgrade_data = list(load_json_file('upgrades_list.json').values())
+    while len(player.backpack_seeds) < player.max_backpack_size:
+        player.backpack_seeds.append(Seed.load_seed(seed_data[len(player.backpack_seeds) % len(seed_data)]))
+    while len(player.backpack_upgrades) < player.max_upgrade_capacity:
+        player.backpack_upgrades.append(SoilUpgrade.load_upgrades(upgrade_data[len(player.backpack_upgrades) % len(upgrade_data)]))
+
+
+def spawn_particles(game, frame: int):
+    """Keeps particles alive on the playing board by bursting from one soil every PARTICLE_INTERVAL frames."""
+    if frame % PARTICLE_INTERVAL == 0 and game.soils:
+        game.soils[frame // PARTICLE_INTERVAL % len(game.soils)].spawn_particles(20, PARTICLE_COLOR)
+
+
+def benchmark_scene(game, state: str, frames: int, warmup: int) -> dict:
+    """
+    Switches to a scene and runs the game loop uncapped for a fixed number of frames,
+    each advancing the simulation by exactly one step.
+
+    Args:
+        state (str): Game state of the scene, one of SCENES.
+        frames (int): Frames measured.
+        warmup (int): Frames run first and not measured.
+    """
+    from game_helpers.frame_profiler import frame_profiler
+    from game_helpers.perf_counters import perf_counters
+    if state == game.GAME_STATE_PLAYING:
+        fill_board(game)
+    elif state == game.GAME_STATE_INVENTORY:
+        fill_backpack(game)
+    game.change_state(state)
+    if state == game.GAME_STATE_SHOP:
+        game.shop_scene.generate_products()
+    per_frame = spawn_particles if state == game.GAME_STATE_PLAYING else None
+
+    for frame in range(warmup):
+        if per_frame:
+            per_frame(game, frame)
+        game.run_frame()
+
+    frame_profiler.reset()
+    perf_counters.reset()
+    blocks = sys.getallocatedblocks()
+    start = time.perf_counter()
+    for frame in range(frames):
+        if per_frame:
+            per_frame(game, frame)
+        game.run_frame()
+    elapsed = time.perf_counter() - start
+    allocated_blocks = sys.getallocatedblocks() - blocks
+
+    summary = frame_profiler.summary(state)
+    return {
+        "frames": frames,
+        "fps": frames / elapsed if elapsed else 0.0,
+        "frame_ms": {key: summary[key] for key in ("p50", "p95", "p99", "max")},
+        "phases_ms": summary["phases"],
+        "slowest_phase": summary["slowest_phase"],
+        "allocations_per_frame": perf_counters.per_frame(state),
+        "python_blocks_delta": allocated_blocks,
+    }
+
+
+def run(scenes=SCENES, frames: int = BENCHMARK_FRAMES, warmup: int = WARMUP_FRAMES) -> dict:
+    """Starts the game headless and benchmarks each scene in turn."""
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    os.chdir(ROOT) # assets are loaded relative to the repository root
+    import pygame
+    from main import Game
+    from game_helpers.frame_profiler import frame_profiler
+    from game_helpers.perf_counters import perf_counters
+    frame_profiler.enabled = True
+    perf_counters.enable()
+
+    game = Game()
+    game.uncapped = True
+    game.fixed_step = True # every frame simulates one step, so versions that draw faster do the same game work
+    game.finish_startup()
+    while game.asset_loader.busy():
+        game.run_startup_step()
+
+    results = {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "video_driver": pygame.display.get_driver(),
+        "frames": frames,
+        "warmup": warmup,
+        "scenes": {},
+    }
+    for state in scenes:
+        results["scenes"][state] = benchmark_scene(game, state, frames, warmup)
+    pygame.quit()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark each scene headless, with the frame cap off, and print JSON.")
+    parser.add_argument("--frames", type=int, default=BENCHMARK_FRAMES)
+    parser.add_argument("--warmup", type=int, default=WARMUP_FRAMES)
+    parser.add_argument("--scenes", nargs="+", default=list(SCENES), choices=SCENES, metavar="SCENE",
+                        help=f"game states to run (default: all of {', '.join(SCENES)})")
+    parser.add_argument("--output", default=None, help="write the JSON here instead of printing it")
+    args = parser.parse_args()
+    results = run(args.scenes, args.frames, args.warmup)
+    report = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(report)
+        print(f"Benchmark of {len(results['scenes'])} scenes written to {args.output}")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+from collections import deque
+
+
+class SceneManager:
+    """
+    Creates scenes on first use and switches between them.
+
+    Scenes may define on_enter(previous_state) and on_exit(next_state) hooks.
+    Scenes registered with persistent=False are dropped when they are left,
+    and the likely next scenes of the current one are built ahead of time by
+    prefetch_next(), which the game loop calls between frames.
+    """
+    def __init__(self):
+        self.factories = {}
+        self.persistent = {}
+        self.prefetch_targets = {}
+        self.scenes = {}
+        self.current_state = None
+        self.pending_prefetch = deque()
+
+    def register(self, state: str, factory, persistent: bool = True, prefetch: tuple = ()):
+        """
+        Registers how to build the scene for a state.
+
+        Args:
+            state (str): Game state the scene handles.
+            factory (callable): Builds the scene, called with no arguments.
+            persistent (bool): Keep the scene alive after it is left.
+            prefetch (tuple): States likely to follow this one; they are built in the background.
+        """
+        self.factories[state] = factory
+        self.persistent[state] = persistent
+        self.prefetch_targets[state] = tuple(prefetch)
+
+    def get(self, state: str):
+        """Returns the scene for a state, creating it if needed."""
+        scene = self.scenes.get(state)
+        if scene is None:
+            scene = self.factories[state]()
+            self.scenes[state] = scene
+        return scene
+
+    def is_loaded(self, state: str) -> bool:
+        return state in self.scenes
+
+    @property
+    def current(self):
+        return self.get(self.current_state)
+
+    def change(self, new_state: str):
+        """Switches scenes, running the exit hook of the old one and the enter hook of the new one."""
+        old_state = self.current_state
+        if old_state == new_state:
+            return
+        old_scene = self.scenes.get(old_state)
+        if old_scene is not None:
+            on_exit = getattr(old_scene, "on_exit", None)
+            if on_exit:
+                on_exit(new_state)
+            if not self.persistent.get(old_state, True):
+                self.discard(old_state)
+
+        self.current_state = new_state
+        on_enter = getattr(self.current, "on_enter", None)
+        if on_enter:
+            on_enter(old_state)
+
+        self.pending_prefetch.clear()
+        self.pending_prefetch.extend(self.prefetch_targets.get(new_state, ()))
+
+    def discard(self, state: str):
+        """Drops a scene so its resources can be freed; it is rebuilt on next use."""
+        self.scenes.pop(state, None)
+
+    def prefetch_next(self):
+        """Builds at most one pending prefetch scene. Call once per frame after drawing."""
+        while self.pending_prefetch:
+            state = self.pending_prefetch.popleft()
+            if state not in self.scenes:
+                self.get(state)
+                return
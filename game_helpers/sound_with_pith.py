@@ -1,17 +1,299 @@
-import numpy as np
+from collections import OrderedDict
+import queue
+import threading
+import time
 import pygame
-def play_sound_with_pitch(path, pitch_factor=1.0):
-    sound = pygame.mixer.Sound(path)
-    arr = pygame.sndarray.array(sound)
-
-    new_length = int(arr.shape[0] / pitch_factor)
-    arr_resampled = np.interp(
-        np.linspace(0, arr.shape[0], new_length, endpoint=False),
-        np.arange(arr.shape[0]),
-        arr[:, 0] if arr.ndim > 1 else arr
-    )
-    if arr.ndim > 1:
-        arr_resampled = np.column_stack([arr_resampled, arr_resampled])
-    sound_resampled = pygame.sndarray.make_sound(arr_resampled.astype(arr.dtype))
-    sound_resampled.set_volume(0.1)
-    sound_resampled.play()
\ No newline at end of file
+from game_helpers.voice_pool import VoicePool, DEFAULT_CATEGORY
+from game_helpers.perf_counters import perf_counters
+
+SOUND_VOLUME = 0.1
+PITCH_STEP = 0.02 # pitch factors are rounded to this step so jittered pitches share cache entries
+VARIANT_CACHE_BUDGET = 16 * 1024 * 1024 # bytes of resampled audio kept in memory
+MAX_PENDING_SOUNDS = 16 # resample requests waiting for the worker before the oldest is dropped
+STALE_SOUND_MS = 120 # a sound that could not start within this many ms is skipped
+
+
+class SoundBank:
+    """
+    Decodes every sound effect once and keeps an LRU cache of its pitched variants.
+    """
+    def __init__(self, cache_budget: int = VARIANT_CACHE_BUDGET, pitch_step: float = PITCH_STEP):
+        """
+        Args:
+            cache_budget (int): Maximum number of bytes of resampled variants to keep.
+            pitch_step (float): Pitch factors are quantized to multiples of this value.
+        """
+        self.cache_budget = cache_budget
+        self.pitch_step = pitch_step
+        self.samples: dict = {} # path -> int16 numpy array
+        self.volumes: dict[str, float] = {}
+        self.variants: OrderedDict = OrderedDict() # (path, bucket) -> (Sound, nbytes)
+        self.building: dict = {} # (path, bucket) -> Event set once the thread resampling it is done
+        self.cached_bytes = 0
+        self.lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.decodes = 0
+        self.evictions = 0
+
+    def get_samples(self, path: str):
+        """Returns the decoded int16 sample array for a file, decoding it on first use."""
+        samples = self.samples.get(path)
+        if samples is None:
+            import pygame.sndarray # imported on first use, it pulls in numpy
+            samples = pygame.sndarray.array(pygame.mixer.Sound(path))
+            perf_counters.incr("sound_loads")
+            with self.lock:
+                self.samples[path] = samples
+                self.decodes += 1
+        return samples
+
+    def pitch_bucket(self, pitch_factor: float) -> int:
+        return max(1, round(pitch_factor / self.pitch_step))
+
+    def get_cached(self, path: str, pitch_factor: float = 1.0) -> pygame.mixer.Sound | None:
+        """Returns the cached variant for the pitch, or None without resampling anything."""
+        key = (path, self.pitch_bucket(pitch_factor))
+        with self.lock:
+            entry = self.variants.get(key)
+            if entry is None:
+                return None
+            self.variants.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def get_pitched(self, path: str, pitch_factor: float = 1.0) -> pygame.mixer.Sound:
+        """
+        Returns a Sound for the file played at (roughly) the given pitch.
+
+        A variant is resampled by one thread at a time; other threads asking for it wait for that one.
+        """
+        bucket = self.pitch_bucket(pitch_factor)
+        key = (path, bucket)
+        while True:
+            with self.lock:
+                entry = self.variants.get(key)
+                if entry is not None:
+                    self.variants.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+                building = self.building.get(key)
+                if building is None:
+                    building = self.building[key] = threading.Event()
+                    self.misses += 1
+                    break
+            building.wait()
+
+        try:
+            arr_resampled = self.resample(self.get_samples(path), bucket * self.pitch_step)
+            perf_counters.incr("resamples")
+            sound = self.make_sound(path, arr_resampled)
+            with self.lock:
+                self._store(key, sound, arr_resampled.nbytes)
+        finally:
+            with self.lock:
+                del self.building[key]
+            building.set()
+        return sound
+
+    def add_variant(self, path: str, bucket: int, arr_resampled) -> pygame.mixer.Sound:
+        """Stores samples resampled elsewhere (see ResampleWorker) as a variant, unless it is cached already."""
+        key = (path, bucket)
+        with self.lock:
+            entry = self.variants.get(key)
+            if entry is not None:
+                self.variants.move_to_end(key)
+                return entry[0]
+            sound = self.make_sound(path, arr_resampled)
+            self.misses += 1
+            self._store(key, sound, arr_resampled.nbytes)
+        return sound
+
+    def make_sound(self, path: str, arr_resampled) -> pygame.mixer.Sound:
+        import pygame.sndarray
+        sound = pygame.sndarray.make_sound(arr_resampled)
+        sound.set_volume(self.volumes.get(path, SOUND_VOLUME))
+        return sound
+
+    @staticmethod
+    def resample(arr, pitch_factor: float):
+        """Resamples the first channel of arr so it plays pitch_factor times faster."""
+        import numpy as np
+        new_length = int(arr.shape[0] / pitch_factor)
+        arr_resampled = np.interp(
+            np.linspace(0, arr.shape[0], new_length, endpoint=False),
+            np.arange(arr.shape[0]),
+            arr[:, 0] if arr.ndim > 1 else arr
+        )
+        if arr.ndim > 1:
+            arr_resampled = np.column_stack([arr_resampled] * arr.shape[1])
+        return np.ascontiguousarray(arr_resampled.astype(arr.dtype))
+
+    def _store(self, key, sound: pygame.mixer.Sound, nbytes: int):
+        old = self.variants.pop(key, None)
+        if old is not None:
+            self.cached_bytes -= old[1]
+        self.variants[key] = (sound, nbytes)
+        self.cached_bytes += nbytes
+        while self.cached_bytes > self.cache_budget and len(self.variants) > 1:
+            _, (_, evicted_bytes) = self.variants.popitem(last=False)
+            self.cached_bytes -= evicted_bytes
+            self.evictions += 1
+
+    def preload(self, path: str, volume: float = SOUND_VOLUME):
+        """Decodes a file and builds its unpitched variant ahead of time."""
+        self.volumes[path] = volume
+        self.get_pitched(path, 1.0)
+
+    def clear(self):
+        with self.lock:
+            self.samples.clear()
+            self.variants.clear()
+            self.cached_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.decodes = 0
+            self.evictions = 0
+
+    def stats(self) -> dict:
+        """Returns cache counters, e.g. to check the hit rate after a long session."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "decodes": self.decodes,
+            "evictions": self.evictions,
+            "variants": len(self.variants),
+            "cached_bytes": self.cached_bytes,
+        }
+
+
+class ResampleWorker:
+    """
+    Resamples cold pitch variants on a background thread so the render thread never runs np.interp.
+    The thread only does numpy work: files are decoded in submit() and the resampled samples are
+    turned into Sounds, cached and started by play_ready(), both on the main thread.
+    """
+    def __init__(self, bank: SoundBank, max_pending: int = MAX_PENDING_SOUNDS):
+        self.bank = bank
+        self.requests = queue.Queue(maxsize=max_pending)
+        self.ready = queue.Queue()
+        self.thread = None
+
+        self.dropped_full = 0
+        self.dropped_stale = 0
+        self.failed = 0
+        self.last_error = None
+
+    def submit(self, path: str, pitch_factor: float, category: str = DEFAULT_CATEGORY, max_delay_ms: int | None = STALE_SOUND_MS):
+        """Queues a sound; when the queue is full the oldest pending request is dropped."""
+        try:
+            samples = self.bank.get_samples(path) # decoded once, effects are usually preloaded
+        except (pygame.error, FileNotFoundError) as e:
+            self.failed += 1
+            self.last_error = f"{path}: {e}"
+            return
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name="sound-resampler", daemon=True)
+            self.thread.start()
+
+        deadline = None if max_delay_ms is None else time.perf_counter() + max_delay_ms / 1000
+        request = (path, samples, self.bank.pitch_bucket(pitch_factor), category, deadline)
+        while True:
+            try:
+                self.requests.put_nowait(request)
+                return
+            except queue.Full:
+                try:
+                    self.requests.get_nowait()
+                    self.requests.task_done()
+                    self.dropped_full += 1
+                except queue.Empty:
+                    pass
+
+    def _run(self):
+        while True:
+            request = self.requests.get()
+            try:
+                self._resample(*request)
+            finally:
+                self.requests.task_done()
+
+    def _resample(self, path: str, samples, bucket: int, category: str, deadline: float | None):
+        if deadline is not None and time.perf_counter() > deadline:
+            self.dropped_stale += 1
+            return
+        arr_resampled = self.bank.resample(samples, bucket * self.bank.pitch_step)
+        perf_counters.incr("resamples")
+        self.ready.put((path, bucket, arr_resampled, category, deadline))
+
+    def busy(self) -> bool:
+        """True while a requested sound is still being resampled or waiting to be started."""
+        return self.requests.unfinished_tasks > 0 or not self.ready.empty()
+
+    def play_ready(self):
+        """Caches every resampled variant and starts those still fresh. Call once per frame on the main thread."""
+        while True:
+            try:
+                path, bucket, arr_resampled, category, deadline = self.ready.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                sound = self.bank.add_variant(path, bucket, arr_resampled)
+            except pygame.error as e:
+                self.failed += 1
+                self.last_error = f"{path}: {e}"
+                continue
+            if deadline is not None and time.perf_counter() > deadline:
+                self.dropped_stale += 1
+                continue
+            get_voice_pool().play(sound, category, path)
+
+    def stats(self) -> dict:
+        return {
+            "pending": self.requests.qsize(),
+            "dropped_full": self.dropped_full,
+            "dropped_stale": self.dropped_stale,
+            "failed": self.failed,
+            "last_error": self.last_error,
+        }
+
+
+sound_bank = SoundBank()
+resample_worker = ResampleWorker(sound_bank)
+voice_pool = None
+
+
+def get_voice_pool() -> VoicePool:
+    """Returns the shared VoicePool, creating it once the mixer is initialised."""
+    global voice_pool
+    if voice_pool is None:
+        voice_pool = VoicePool()
+    return voice_pool
+
+
+def play_sound_with_pitch(path, pitch_factor=1.0, category=DEFAULT_CATEGORY, max_delay_ms=STALE_SOUND_MS):
+    """
+    Plays a sound effect at the given pitch. Cached variants start immediately,
+    cold ones are resampled by the worker and started by play_ready_sounds().
+
+    Args:
+        category (str): Voice pool category ("ui", "harvest", "upgrade" or "stinger").
+        max_delay_ms (int | None): Skip the sound if it cannot start within this time, None to never skip.
+    """
+    sound = sound_bank.get_cached(path, pitch_factor)
+    if sound is not None:
+        get_voice_pool().play(sound, category, path)
+    else:
+        resample_worker.submit(path, pitch_factor, category, max_delay_ms)
+
+
+def play_ready_sounds():
+    resample_worker.play_ready()
+
+
+def sounds_pending() -> bool:
+    """True while a sound requested with play_sound_with_pitch has not started yet."""
+    return resample_worker.busy()
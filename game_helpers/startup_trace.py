@@ -0,0 +1,55 @@
+import os
+import time
+
+STARTUP_REPORT_PATH = "startup_trace.txt"
+FIRST_FRAME_TARGET_MS = 300
+
+
+class StartupTrace:
+    """
+    Records a timestamp for each startup phase, from the first import in
+    main.py to the first presented frame and the deferred work after it.
+    Enable the written report with --startup-trace or PLANTBAY_STARTUP_TRACE=1.
+    """
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.marks: list[tuple[str, float]] = []
+        self.enabled = os.environ.get("PLANTBAY_STARTUP_TRACE") == "1"
+        self.finished = False
+
+    def mark(self, phase: str):
+        """Records the end of a phase."""
+        self.marks.append((phase, time.perf_counter()))
+
+    def elapsed_ms(self, phase: str) -> float | None:
+        for name, timestamp in self.marks:
+            if name == phase:
+                return (timestamp - self.start) * 1000
+        return None
+
+    def report(self) -> str:
+        lines = [f"{'phase':<28}{'took ms':>10}{'total ms':>10}"]
+        previous = self.start
+        for phase, timestamp in self.marks:
+            lines.append(f"{phase:<28}{(timestamp - previous) * 1000:>10.1f}{(timestamp - self.start) * 1000:>10.1f}")
+            previous = timestamp
+        first_frame = self.elapsed_ms("first frame")
+        if first_frame is not None:
+            verdict = "OK" if first_frame <= FIRST_FRAME_TARGET_MS else "over target"
+            lines.append(f"first frame after {first_frame:.1f} ms (target {FIRST_FRAME_TARGET_MS} ms, {verdict})")
+        lines.append("(interpreter startup before main.py is not included)")
+        return "\n".join(lines)
+
+    def finish(self, path: str = STARTUP_REPORT_PATH):
+        """Writes the report once, if tracing is enabled."""
+        if self.finished:
+            return
+        self.finished = True
+        if self.enabled:
+            report = self.report()
+            print(report)
+            with open(path, 'w') as f:
+                f.write(report + "\n")
+
+
+startup_trace = StartupTrace()
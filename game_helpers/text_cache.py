@@ -0,0 +1,74 @@
+from collections import OrderedDict
+import pygame
+from game_helpers.perf_counters import perf_counters
+
+FONT_PATH = "assets/fonts/pixelFont.ttf"
+TEXT_CACHE_SIZE = 512 # rendered strings kept before the least recently used is dropped
+
+_fonts: dict[tuple[str | None, int], pygame.font.Font] = {}
+
+
+def get_font(size: int, path: str | None = FONT_PATH) -> pygame.font.Font:
+    """
+    Returns the shared Font for (path, size), opening it on first use.
+
+    Args:
+        size (int): Font size in points.
+        path (str | None): Font file, None for pygame's default font.
+    """
+    font = _fonts.get((path, size))
+    if font is None:
+        font = pygame.font.Font(path, size)
+        perf_counters.incr("fonts")
+        _fonts[(path, size)] = font
+    return font
+
+
+class TextCache:
+    """
+    LRU cache of rendered text surfaces keyed by (font, text, color, antialias),
+    so unchanged labels cost a dictionary lookup instead of a font.render per frame.
+    """
+    def __init__(self, max_entries: int = TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.surfaces: OrderedDict = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font: pygame.font.Font, text: str, color: tuple, antialias: bool = True) -> pygame.Surface:
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        perf_counters.incr("font_renders")
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self.surfaces),
+            "fonts": len(_fonts),
+        }
+
+
+text_cache = TextCache()
+
+
+def render_text(font: pygame.font.Font, text: str, color: tuple, antialias: bool = True) -> pygame.Surface:
+    """Renders text through the shared cache. The returned surface is shared and must not be drawn on."""
+    return text_cache.render(font, text, color, antialias)
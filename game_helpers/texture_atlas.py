@@ -0,0 +1,199 @@
+import hashlib
+import json
+import os
+import pygame
+from game_helpers.json_loader import load_json_file
+from game_helpers.perf_counters import perf_counters
+from tilesets.background_tileset import TILE_SIZE, Main_tiles, Backpack_tiles, Shop_tiles
+
+ATLAS_PAGE_SIZE = 512
+ATLAS_PADDING = 1 # transparent pixels between regions
+ATLAS_CACHE_DIR = ".cache/atlas"
+ATLAS_INDEX_FILE = "atlas.json"
+
+
+class TextureAtlas:
+    """
+    Packs many small images into a few large page surfaces. get() returns a
+    subsurface of a page, so objects keep blitting it like any other image
+    while the pixels live in one shared surface.
+    """
+    def __init__(self, page_size: int = ATLAS_PAGE_SIZE, padding: int = ATLAS_PADDING):
+        self.page_size = page_size
+        self.padding = padding
+        self.pages: list[pygame.Surface] = []
+        self.regions: dict[tuple, tuple[int, pygame.Rect]] = {} # (path, size) -> (page index, rect)
+        self.region_surfaces: dict[tuple, pygame.Surface] = {}
+
+    @staticmethod
+    def region_key(path: str, size) -> tuple:
+        return (path, tuple(size))
+
+    def build(self, images: dict[tuple, pygame.Surface]):
+        """
+        Packs the images into pages with a simple shelf packer (tallest first).
+
+        Args:
+            images (dict): (path, size) -> Surface already scaled to size.
+        """
+        order = sorted(images, key=lambda key: (images[key].get_height(), images[key].get_width()), reverse=True)
+        page = None
+        shelf_x = shelf_y = shelf_height = 0
+        for key in order:
+            image = images[key]
+            width = image.get_width() + self.padding
+            height = image.get_height() + self.padding
+            if width > self.page_size or height > self.page_size:
+                continue # too large to share a page, stays a standalone image
+            if page is not None and shelf_x + width > self.page_size:
+                shelf_x, shelf_y, shelf_height = 0, shelf_y + shelf_height, 0
+            if page is None or shelf_y + height > self.page_size:
+                page = self._new_page()
+                shelf_x = shelf_y = shelf_height = 0
+            rect = pygame.Rect(shelf_x, shelf_y, image.get_width(), image.get_height())
+            page.blit(image, rect)
+            self.regions[key] = (len(self.pages) - 1, rect)
+            shelf_x += width
+            shelf_height = max(shelf_height, height)
+
+    def _new_page(self) -> pygame.Surface:
+        page = pygame.Surface((self.page_size, self.page_size), pygame.SRCALPHA).convert_alpha()
+        page.fill((0, 0, 0, 0))
+        perf_counters.incr("surfaces")
+        self.pages.append(page)
+        return page
+
+    def get(self, path: str, size) -> pygame.Surface | None:
+        """Returns the atlas region for (path, size) as a subsurface, or None if it is not packed."""
+        key = self.region_key(path, size)
+        surface = self.region_surfaces.get(key)
+        if surface is None:
+            region = self.regions.get(key)
+            if region is None:
+                return None
+            page_index, rect = region
+            surface = self.pages[page_index].subsurface(rect)
+            self.region_surfaces[key] = surface
+        return surface
+
+    def save(self, directory: str, digest: str):
+        """Writes the pages as PNG files plus an index so the next run can skip packing."""
+        os.makedirs(directory, exist_ok=True)
+        page_files = []
+        for index, page in enumerate(self.pages):
+            filename = f"page{index}.png"
+            pygame.image.save(page, os.path.join(directory, filename))
+            page_files.append(filename)
+        index = {
+            "digest": digest,
+            "page_size": self.page_size,
+            "pages": page_files,
+            "regions": [[path, list(size), page, list(rect)] for (path, size), (page, rect) in self.regions.items()],
+        }
+        with open(os.path.join(directory, ATLAS_INDEX_FILE), 'w') as f:
+            json.dump(index, f)
+
+    @classmethod
+    def read_saved(cls, directory: str, digest: str):
+        """
+        Reads an atlas written by save() without converting its pages, so it can
+        run on a loader thread. Returns None if it is missing or stale.
+        """
+        index_path = os.path.join(directory, ATLAS_INDEX_FILE)
+        if not os.path.exists(index_path):
+            return None
+        try:
+            index = load_json_file(index_path)
+            if index.get("digest") != digest:
+                return None
+            atlas = cls(index["page_size"])
+            for filename in index["pages"]:
+                atlas.pages.append(pygame.image.load(os.path.join(directory, filename)))
+                perf_counters.incr("image_loads")
+            for path, size, page, rect in index["regions"]:
+                atlas.regions[cls.region_key(path, size)] = (page, pygame.Rect(rect))
+        except (OSError, ValueError, KeyError, pygame.error) as e:
+            print(f"Ignoring saved texture atlas: {e}")
+            return None
+        return atlas
+
+    @classmethod
+    def load_saved(cls, directory: str, digest: str):
+        """Loads an atlas written by save(), or returns None if it is missing or stale."""
+        atlas = cls.read_saved(directory, digest)
+        if atlas is not None:
+            atlas.convert_pages()
+        return atlas
+
+    def convert_pages(self):
+        """Converts pages read by read_saved() for the display. Must run on the main thread."""
+        self.pages = [page.convert_alpha() for page in self.pages]
+        self.region_surfaces.clear()
+
+
+def default_atlas_entries(soil_size: int) -> list[tuple]:
+    """Lists every seed, upgrade, soil and tile image at the size it is drawn at."""
+    entries = []
+    for seed in load_json_file('seed_list.json').values():
+        entries.append(TextureAtlas.region_key(seed["image"], seed["size"]))
+    for upgrade in load_json_file('upgrades_list.json').values():
+        entries.append(TextureAtlas.region_key(upgrade["image"], upgrade["size"]))
+    for soil_image in ("assets/soils/soil.png", "assets/soils/planted_soil.png"):
+        entries.append(TextureAtlas.region_key(soil_image, (soil_size, soil_size)))
+    for tiles in (Main_tiles, Backpack_tiles, Shop_tiles):
+        for filename in tiles.values():
+            entries.append(TextureAtlas.region_key(filename, (TILE_SIZE, TILE_SIZE)))
+    entries.append(TextureAtlas.region_key("assets/animated_coins.png", (30, 30)))
+    entries.append(TextureAtlas.region_key("assets/backpack.png", (80, 80)))
+    return list(dict.fromkeys(entries))
+
+
+def atlas_digest(entries: list[tuple]) -> str:
+    """Hashes the entry list and the content of every source file."""
+    digest = hashlib.sha1()
+    for path, size in entries:
+        digest.update(f"{path}:{size[0]}x{size[1]};".encode())
+        with open(path, 'rb') as f:
+            digest.update(hashlib.sha1(f.read()).digest())
+    return digest.hexdigest()
+
+
+def read_default_atlas(image_cache, soil_size: int, cache_dir: str = ATLAS_CACHE_DIR) -> dict:
+    """
+    Does the file work of build_default_atlas() without touching the display:
+    reads the saved atlas if its sources did not change, otherwise decodes the
+    images to pack. Safe to run on a loader thread.
+    """
+    entries = default_atlas_entries(soil_size)
+    digest = atlas_digest(entries)
+    atlas = TextureAtlas.read_saved(cache_dir, digest)
+    images = {key: image_cache.read(*key) for key in entries} if atlas is None else {}
+    return {"digest": digest, "atlas": atlas, "images": images}
+
+
+def install_default_atlas(image_cache, prepared: dict, cache_dir: str = ATLAS_CACHE_DIR) -> TextureAtlas:
+    """
+    Finishes an atlas from read_default_atlas() on the main thread, packing and
+    saving it if needed, and installs it into image_cache so load_image()
+    serves atlas regions for the packed (path, size) pairs.
+    """
+    atlas = prepared["atlas"]
+    if atlas is not None:
+        atlas.convert_pages()
+    else:
+        atlas = TextureAtlas()
+        atlas.build({key: image.convert_alpha() if needs_convert else image
+                     for key, (image, needs_convert) in prepared["images"].items()})
+        try:
+            atlas.save(cache_dir, prepared["digest"])
+        except (OSError, pygame.error) as e:
+            print(f"Could not save texture atlas: {e}")
+    image_cache.atlas = atlas
+    for path, size in atlas.regions:
+        image_cache.discard(path, size)
+    return atlas
+
+
+def build_default_atlas(image_cache, soil_size: int, cache_dir: str = ATLAS_CACHE_DIR) -> TextureAtlas:
+    """Loads or packs the default atlas and installs it into image_cache in one go."""
+    return install_default_atlas(image_cache, read_default_atlas(image_cache, soil_size, cache_dir), cache_dir)
@@ -1,24 +1,84 @@
 import pygame
-import os
+from game_helpers.asset_cache import load_image
+from game_helpers.render_queue import queue_blit
+
+MAX_BAKED_MAP_SIZE = 2048 # maps up to this many pixels wide and high are baked into a single surface
+CHUNK_TILES = 16 # larger maps are cached in chunks of CHUNK_TILES x CHUNK_TILES tiles
 
 class TilemapGenerator:
+    """
+    Draws a tile map from pre-rendered surfaces. A map that fits in
+    MAX_BAKED_MAP_SIZE is baked into one surface; larger maps are split into
+    fixed-size chunks so only the chunks on screen are drawn and a changed
+    tile only re-renders its own chunk.
+    """
     def __init__(self, tile_map: list[list[int]], tile_size: int, tile_types: dict):
-        self.tile_map = tile_map
+        self.tile_map = [list(row) for row in tile_map] # own copy, set_tile must not edit the shared map
         self.tile_size = tile_size
         self.tiles = {}
 
+        rows = len(self.tile_map)
+        cols = max((len(row) for row in self.tile_map), default=0)
+        if cols * tile_size <= MAX_BAKED_MAP_SIZE and rows * tile_size <= MAX_BAKED_MAP_SIZE:
+            self.chunk_cols, self.chunk_rows = max(cols, 1), max(rows, 1)
+        else:
+            self.chunk_cols = self.chunk_rows = CHUNK_TILES
+        self.chunks: dict[tuple[int, int], pygame.Surface | None] = {} # (chunk x, chunk y) -> surface, None when stale
+        for chunk_y in range((rows + self.chunk_rows - 1) // self.chunk_rows):
+            for chunk_x in range((cols + self.chunk_cols - 1) // self.chunk_cols):
+                self.chunks[(chunk_x, chunk_y)] = None
+
+        self.chunk_renders = 0
         self.load_tiles(tile_types)
 
     def load_tiles(self, tile_types: dict):
         """Loads all unique tile images from specified paths."""
         for tile_id, filename in tile_types.items():
-            image = pygame.image.load(filename).convert_alpha()
-            self.tiles[tile_id] = pygame.transform.scale(image, (self.tile_size, self.tile_size))
-
-    def draw(self, screen: pygame.Surface):
-        """Draws the tilemap onto the given screen."""
-        for row_idx, row in enumerate(self.tile_map):
-            for col_idx, tile_id in enumerate(row):
-                if tile_id in self.tiles:
-                    tile_image = self.tiles[tile_id]
-                    screen.blit(tile_image, (col_idx * self.tile_size, row_idx * self.tile_size))
\ No newline at end of file
+            self.tiles[tile_id] = load_image(filename, (self.tile_size, self.tile_size))
+        self.invalidate()
+
+    def set_tile(self, row: int, col: int, tile_id: int):
+        """Changes one tile; only the chunk containing it is re-rendered."""
+        if self.tile_map[row][col] == tile_id:
+            return
+        self.tile_map[row][col] = tile_id
+        self.chunks[(col // self.chunk_cols, row // self.chunk_rows)] = None
+
+    def invalidate(self):
+        """Marks every chunk for re-rendering, e.g. after the tile images changed."""
+        for key in self.chunks:
+            self.chunks[key] = None
+
+    def _render_chunk(self, chunk_x: int, chunk_y: int) -> pygame.Surface:
+        first_row, first_col = chunk_y * self.chunk_rows, chunk_x * self.chunk_cols
+        rows = self.tile_map[first_row:first_row + self.chunk_rows]
+        width = max(len(row[first_col:first_col + self.chunk_cols]) for row in rows) * self.tile_size
+        surface = pygame.Surface((width, len(rows) * self.tile_size), pygame.SRCALPHA).convert_alpha()
+        surface.fill((0, 0, 0, 0))
+        surface.blits([
+            (self.tiles[tile_id], (col_idx * self.tile_size, row_idx * self.tile_size))
+            for row_idx, row in enumerate(rows)
+            for col_idx, tile_id in enumerate(row[first_col:first_col + self.chunk_cols])
+            if tile_id in self.tiles
+        ], doreturn=False)
+        self.chunks[(chunk_x, chunk_y)] = surface
+        self.chunk_renders += 1
+        return surface
+
+    def draw(self, screen: pygame.Surface, offset: tuple[int, int] = (0, 0)):
+        """
+        Draws the tilemap onto the given screen.
+
+        Args:
+            offset (tuple[int, int]): Screen position of the map's top-left corner, for scrolling maps.
+        """
+        chunk_width = self.chunk_cols * self.tile_size
+        chunk_height = self.chunk_rows * self.tile_size
+        view = screen.get_clip()
+        for (chunk_x, chunk_y), surface in self.chunks.items():
+            position = (offset[0] + chunk_x * chunk_width, offset[1] + chunk_y * chunk_height)
+            if not view.colliderect((position, (chunk_width, chunk_height))):
+                continue
+            if surface is None:
+                surface = self._render_chunk(chunk_x, chunk_y)
+            queue_blit(screen, surface, position)
@@ -0,0 +1,143 @@
+from collections import OrderedDict
+import pygame
+from game_helpers.text_cache import get_font
+from game_helpers.layers import LAYER_OVERLAY
+from game_helpers.render_queue import queue_blit
+from game_helpers.perf_counters import perf_counters
+
+TOOLTIP_CACHE_SIZE = 128 # finished popup surfaces kept before the least recently used is dropped
+TOOLTIP_MARGIN = 5 # gap between the popup and the item it describes
+
+
+class TooltipStyle:
+    """Look of a hover popup. Styles are compared by value, so equal styles share cache entries."""
+    def __init__(self, font_size: int = 14, title_color: tuple = (255, 255, 0), text_color: tuple = (255, 255, 255),
+                 background_color: tuple = (30, 30, 30), border_color: tuple = (100, 100, 100),
+                 padding: int = 5, spacing: int = 2, border_radius: int = 5, max_width: int = 260):
+        """
+        Args:
+            max_width (int): Descriptions wider than this (in pixels, padding excluded) are wrapped.
+        """
+        self.font_size = font_size
+        self.title_color = title_color
+        self.text_color = text_color
+        self.background_color = background_color
+        self.border_color = border_color
+        self.padding = padding
+        self.spacing = spacing
+        self.border_radius = border_radius
+        self.max_width = max_width
+        self.key = (font_size, title_color, text_color, background_color, border_color,
+                    padding, spacing, border_radius, max_width)
+
+
+DEFAULT_TOOLTIP_STYLE = TooltipStyle()
+
+
+def wrap_text(font: pygame.font.Font, text: str, max_width: int) -> list[str]:
+    """Splits text into lines no wider than max_width, breaking at spaces where possible."""
+    lines = []
+    for paragraph in text.split("\n"):
+        line = ""
+        for word in paragraph.split(" "):
+            candidate = f"{line} {word}" if line else word
+            if not line or font.size(candidate)[0] <= max_width:
+                line = candidate
+            else:
+                lines.append(line)
+                line = word
+        lines.append(line)
+    return lines
+
+
+class TooltipCache:
+    """
+    LRU cache of finished tooltip surfaces keyed by (title, text, style), so a
+    hovered item costs one blit per frame and only new content is rendered.
+    """
+    def __init__(self, max_entries: int = TOOLTIP_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.surfaces: OrderedDict = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, title: str | None, text: str, style: TooltipStyle = DEFAULT_TOOLTIP_STYLE) -> pygame.Surface:
+        key = (title, text, style.key)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self._render(title, text, style)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    @staticmethod
+    def _render(title: str | None, text: str, style: TooltipStyle) -> pygame.Surface:
+        font = get_font(style.font_size)
+        lines = []
+        if title:
+            lines.append(font.render(title, True, style.title_color))
+        lines.extend(font.render(line, True, style.text_color) for line in wrap_text(font, text, style.max_width))
+
+        perf_counters.incr("font_renders", len(lines))
+        width = max(line.get_width() for line in lines) + 2 * style.padding
+        height = sum(line.get_height() for line in lines) + style.spacing * (len(lines) - 1) + 2 * style.padding
+        surface = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+        perf_counters.incr("surfaces")
+        surface.fill((0, 0, 0, 0))
+        popup_rect = surface.get_rect()
+        pygame.draw.rect(surface, style.background_color, popup_rect, border_radius=style.border_radius)
+        pygame.draw.rect(surface, style.border_color, popup_rect, 1, border_radius=style.border_radius)
+
+        y = style.padding
+        for line in lines:
+            surface.blit(line, (style.padding, y))
+            y += line.get_height() + style.spacing
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self.surfaces),
+        }
+
+
+tooltip_cache = TooltipCache()
+
+
+def tooltip_rect(anchor: pygame.Rect, title: str | None, text: str, screen_width: int,
+                 style: TooltipStyle = DEFAULT_TOOLTIP_STYLE) -> pygame.Rect:
+    """Where the tooltip for an item is drawn: centred above it and kept on screen horizontally."""
+    rect = tooltip_cache.get(title, text, style).get_rect(midbottom=(anchor.centerx, anchor.top - TOOLTIP_MARGIN))
+    rect.x = max(0, min(rect.x, screen_width - rect.width))
+    return rect
+
+
+def draw_tooltip(screen: pygame.Surface, anchor: pygame.Rect, title: str | None, text: str,
+                 style: TooltipStyle = DEFAULT_TOOLTIP_STYLE) -> pygame.Rect:
+    """
+    Draws the tooltip for an item, on the overlay layer when drawn through the render queue.
+
+    Args:
+        anchor (pygame.Rect): The hovered item; the tooltip sits above it.
+        title (str | None): Highlighted first line, e.g. the item name.
+        text (str): Description, wrapped to the style's max_width.
+
+    Returns:
+        pygame.Rect: The area drawn on.
+    """
+    rect = tooltip_rect(anchor, title, text, screen.get_width(), style)
+    queue_blit(screen, tooltip_cache.get(title, text, style), rect.topleft, LAYER_OVERLAY)
+    return rect
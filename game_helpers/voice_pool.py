@@ -0,0 +1,114 @@
+import time
+import pygame
+
+# category: reserved channels, priority (higher wins when stealing), max simultaneous voices of one effect
+SOUND_CATEGORIES = {
+    "stinger": {"channels": 2, "priority": 3, "max_per_effect": 1},
+    "harvest": {"channels": 6, "priority": 2, "max_per_effect": 4},
+    "upgrade": {"channels": 3, "priority": 2, "max_per_effect": 2},
+    "ui": {"channels": 5, "priority": 1, "max_per_effect": 3},
+}
+DEFAULT_CATEGORY = "ui"
+
+
+class Voice:
+    """A mixer channel owned by the pool and whatever is currently playing on it."""
+    def __init__(self, channel: pygame.mixer.Channel, home_category: str):
+        self.channel = channel
+        self.home_category = home_category
+        self.category = None
+        self.effect = None
+        self.started = 0.0
+
+    def is_busy(self) -> bool:
+        return self.category is not None and self.channel.get_busy()
+
+
+class VoicePool:
+    """
+    Plays sounds on reserved mixer channels grouped by category so a burst of
+    UI clicks can never take the channels needed by harvest sounds or stingers.
+    """
+    def __init__(self, categories: dict = SOUND_CATEGORIES):
+        self.categories = categories
+        total_channels = sum(config["channels"] for config in categories.values())
+        pygame.mixer.set_num_channels(total_channels)
+        # Reserving every channel keeps pygame's own Sound.play() from picking our voices
+        pygame.mixer.set_reserved(total_channels)
+
+        self.voices: list[Voice] = []
+        for category, config in categories.items():
+            for _ in range(config["channels"]):
+                self.voices.append(Voice(pygame.mixer.Channel(len(self.voices)), category))
+
+        self.played = {category: 0 for category in categories}
+        self.stolen = {category: 0 for category in categories}
+        self.dropped = {category: 0 for category in categories}
+
+    def play(self, sound: pygame.mixer.Sound, category: str = DEFAULT_CATEGORY, effect: str = None) -> pygame.mixer.Channel | None:
+        """
+        Plays a sound in the given category, stealing a voice if needed.
+
+        Args:
+            sound (pygame.mixer.Sound): The sound to play.
+            category (str): One of the keys of SOUND_CATEGORIES.
+            effect (str): Identifies the effect (usually its path) for the per-effect voice cap.
+
+        Returns:
+            pygame.mixer.Channel | None: The channel used, or None if the sound was dropped.
+        """
+        if category not in self.categories:
+            category = DEFAULT_CATEGORY
+        voice = self._find_voice(category, effect)
+        if voice is None:
+            self.dropped[category] += 1
+            return None
+
+        if voice.is_busy():
+            self.stolen[voice.category] += 1
+        voice.category = category
+        voice.effect = effect
+        voice.started = time.perf_counter()
+        voice.channel.play(sound)
+        self.played[category] += 1
+        return voice.channel
+
+    def _find_voice(self, category: str, effect: str) -> Voice | None:
+        config = self.categories[category]
+        priority = config["priority"]
+        busy = [voice for voice in self.voices if voice.is_busy()]
+
+        # Per-effect cap: retrigger the oldest copy of the same effect
+        same_effect = [voice for voice in busy if voice.effect == effect and voice.category == category]
+        if effect is not None and len(same_effect) >= config["max_per_effect"]:
+            return min(same_effect, key=lambda voice: voice.started)
+
+        # Free channel of our own category, then a free one of any lower-priority category
+        free = [voice for voice in self.voices if not voice.is_busy()]
+        for voice in free:
+            if voice.home_category == category:
+                return voice
+        borrowable = [voice for voice in free if self.categories[voice.home_category]["priority"] < priority]
+        if borrowable:
+            return borrowable[0]
+
+        # Steal the oldest voice we outrank, falling back to the oldest voice of our own category
+        stealable = [voice for voice in busy if self.categories[voice.category]["priority"] < priority]
+        if not stealable:
+            stealable = [voice for voice in busy if voice.category == category]
+        if stealable:
+            return min(stealable, key=lambda voice: voice.started)
+        return None
+
+    def usage(self) -> dict:
+        """Returns per-category channel use and counters."""
+        report = {}
+        for category, config in self.categories.items():
+            report[category] = {
+                "reserved": config["channels"],
+                "busy": sum(1 for voice in self.voices if voice.is_busy() and voice.category == category),
+                "played": self.played[category],
+                "stolen": self.stolen[category],
+                "dropped": self.dropped[category],
+            }
+        return report
@@ -1,13 +1,20 @@
 import pygame
 from game_objects.seed import Seed
 import random
-from game_effects.particles import ParticleSystem
-from game_helpers.sound_with_pith import play_sound_with_pitch
+from game_effects.particles import particle_engine
+from game_helpers.audio_manager import play_effect
+from game_helpers.asset_cache import load_image
+from game_helpers.tooltip import draw_tooltip, tooltip_rect
+from game_helpers.dirty_rects import mark_dirty
+from game_helpers.render_queue import queue_blit
+from game_helpers.perf_counters import perf_counters
+from game_helpers.frame_cache import scaled_frame, tint_overlay
+
+UPGRADE_OVERLAY_ALPHA = 100
 
 class Soil:
     def __init__(self , x: int, y:int , size:int, image_path:str, default_color: tuple):
-        self.image = pygame.image.load(image_path).convert_alpha() 
-        self.image = pygame.transform.scale(self.image, (size, size))
+        self.image = load_image(image_path, (size, size))
 
         self.rect = self.image.get_rect(topleft=(x, y)) 
         self.original_image = self.image 
@@ -43,33 +50,30 @@ class Soil:
         self.scale = 1.0
         self.target_scale = 1.0
 
-        #Particles
-        self.particle_system = ParticleSystem()
-
         #text popup
-        self.popup_font = pygame.font.Font("assets/fonts/pixelFont.ttf", 14)
         self.is_hovered = False
+        self.shown_multiplier = self.multiplier
         
 
     def draw(self, screen: pygame.Surface):
-        if self.scale != 1.0:
-            scaled_img = pygame.transform.rotozoom(self.image, 0, self.scale)
-            rect = scaled_img.get_rect(center=self.rect.center)
-            screen.blit(scaled_img, rect)
-            image_rect = rect
-        else:
-            screen.blit(self.image, self.rect)
-            image_rect = self.rect
+        # Scaled frames and overlays come from the shared frame cache, scale is quantized to its step
+        scaled_img = scaled_frame(self.image, self.scale)
+        image_rect = scaled_img.get_rect(center=self.rect.center) if scaled_img is not self.image else self.rect
+        queue_blit(screen, scaled_img, image_rect.topleft)
 
         if self.is_upgraded and self.upgraded_color:
-            overlay = pygame.Surface(image_rect.size, pygame.SRCALPHA)
-            overlay.fill((*self.upgraded_color, 100))
-            screen.blit(overlay, image_rect.topleft)
+            queue_blit(screen, tint_overlay(image_rect.size, self.upgraded_color, UPGRADE_OVERLAY_ALPHA), image_rect.topleft)
 
         self.draw_popup_pos(screen)
-        self.particle_system.draw(screen)
+
+    def image_rect(self) -> pygame.Rect:
+        """Screen area covered by the (possibly scaled) soil image."""
+        return scaled_frame(self.image, self.scale).get_rect(center=self.rect.center)
 
     def update(self, dt: int):
+        animating = self.is_shaking or self.scale != self.target_scale
+        if animating:
+            mark_dirty(self.image_rect())
         #Shaking logic
         if self.is_shaking:
             self.shake_timer += dt
@@ -87,12 +91,12 @@ class Soil:
             self.scale += (self.target_scale - self.scale) * 0.2
         else:
             self.scale = self.target_scale
-        # Update particles
-        self.particle_system.update()
+        if animating:
+            mark_dirty(self.image_rect())
 
     def spawn_particles(self , count: int , color):
-        """Spawns particles at the soil's current position."""
-        self.particle_system.emit(self.rect.centerx, self.rect.centery ,count, color)
+        """Spawns particles at the soil's current position, simulated by the shared particle_engine."""
+        particle_engine.emit(self.rect.centerx, self.rect.centery ,count, color)
 
     def set_color(self, color: tuple[int, int, int]):
         """Changes the current display color of the soil (e.g., when planted)."""
@@ -100,9 +104,7 @@ class Soil:
 
     def set_image(self, image_path: str):
         """Sets a new image for the soil."""
-        img = pygame.image.load(image_path).convert_alpha()
-        img = pygame.transform.scale(img, (self.rect.width, self.rect.height))
-        self.image = img
+        self.image = load_image(image_path, (self.rect.width, self.rect.height))
         self.current_image_path = image_path
 
     def reset_color(self):
@@ -113,7 +115,7 @@ class Soil:
         if not self.is_planted:
             self.is_planted = True
             self.planted_seed  = seed_object
-            play_sound_with_pitch("music/sound_effects/plant.wav", pitch_factor=1.0 + random.uniform(-0.2, 0.2))
+            play_effect("plant", pitch_factor=1.0 + random.uniform(-0.2, 0.2))
             self.spawn_particles(20, (50, 168, 82 , 180))
 
     def harvest_seed(self, player=None) :
@@ -186,28 +188,18 @@ class Soil:
         self.shake_offset_y = 0
         
     def update_hoover_screen(self , mouse_pos):
-        self.is_hovered = self.rect.collidepoint(mouse_pos)
+        is_hovered = self.rect.collidepoint(mouse_pos)
+        if is_hovered != self.is_hovered or (is_hovered and self.multiplier != self.shown_multiplier):
+            screen_width = pygame.display.get_surface().get_width()
+            mark_dirty(tooltip_rect(self.rect, None, f'{self.shown_multiplier}X multi', screen_width))
+            mark_dirty(self.popup_rect(screen_width))
+            self.shown_multiplier = self.multiplier
+        self.is_hovered = is_hovered
+
+    def popup_rect(self, screen_width: int) -> pygame.Rect:
+        """Where the hover popup is drawn, kept on screen horizontally."""
+        return tooltip_rect(self.rect, None, f'{self.multiplier}X multi', screen_width)
 
     def draw_popup_pos(self , screen):
         if self.is_hovered:
-            
-            text_surface = self.popup_font.render(f'{self.multiplier}X multi', True, (255, 255, 255))
-
-            padding = 5
-            popup_width = text_surface.get_width() + 2 * padding
-            popup_height = text_surface.get_height() + 2 * padding
-
-            
-            popup_x = self.rect.centerx - popup_width // 2
-            popup_y = self.rect.top - popup_height - 5
-
-            if popup_x < 0:
-                popup_x = 0
-            if popup_x + popup_width > screen.get_width():
-                popup_x = screen.get_width() - popup_width
-
-            popup_rect = pygame.Rect(popup_x, popup_y, popup_width, popup_height)
-            pygame.draw.rect(screen, (30, 30, 30), popup_rect, border_radius=5) 
-            pygame.draw.rect(screen, (100, 100, 100), popup_rect, 1, border_radius=5) 
-
-            screen.blit(text_surface, (popup_x + padding, popup_y + padding))
\ No newline at end of file
+            draw_tooltip(screen, self.rect, None, f'{self.multiplier}X multi')
@@ -1,7 +1,12 @@
 import pygame
 import random
 from game_objects.soil import Soil
-from game_helpers.sound_with_pith import play_sound_with_pitch
+from game_helpers.audio_manager import play_effect
+from game_helpers.asset_cache import load_image
+from game_helpers.tooltip import draw_tooltip, tooltip_rect
+from game_helpers.dirty_rects import mark_dirty
+from game_helpers.render_queue import queue_blit
+from game_helpers.perf_counters import perf_counters
 class SoilUpgrade:
     """
     Class to handle soil upgrades in a game."""
@@ -19,8 +24,7 @@ class SoilUpgrade:
             effect_value (int): The value of the effect (e.g., how much to boost multiplier).
         """
         self.image_path = image_path
-        self.image = pygame.image.load(image_path).convert_alpha()
-        self.image = pygame.transform.scale(self.image, target_size)
+        self.image = load_image(image_path, target_size)
         self.name = name
         self.upgrade_effect = upgrade_effect
         self.rect = self.image.get_rect(topleft=(x, y))
@@ -30,7 +34,6 @@ class SoilUpgrade:
 
         self.is_hovered = False
         self.description = description
-        self.popup_font = pygame.font.Font("assets/fonts/pixelFont.ttf", 14)
 
     
     @classmethod
@@ -54,12 +57,13 @@ class SoilUpgrade:
         Args:
             surface (pygame.Surface): The surface to draw the upgrade on.
         """
-        screen.blit(self.image, self.rect.topleft)
+        queue_blit(screen, self.image, self.rect.topleft)
         self.draw_popup_pos(screen)
 
     def update(self, dt: int):
         #Shaking logic
         if self.is_shaking:
+            mark_dirty(self.rect)
             self.shake_timer += dt
             if self.shake_timer >= self.shake_duration:
                 self.is_shaking = False
@@ -71,6 +75,7 @@ class SoilUpgrade:
                 self.shake_offset_x = random.uniform(-current_intensity, current_intensity)
                 self.shake_offset_y = random.uniform(-current_intensity, current_intensity)
                 self.rect.topleft = (self.original_x + self.shake_offset_x, self.original_y + self.shake_offset_y)
+            mark_dirty(self.rect)
 
     def update_position(self, new_x, new_y):
         """
@@ -80,8 +85,12 @@ class SoilUpgrade:
             x (int): The new x-coordinate.
             y (int): The new y-coordinate.
         """
+        if (new_x, new_y) == self.rect.topleft:
+            return
+        mark_dirty(self.rect)
         self.rect.x = new_x
         self.rect.y = new_y
+        mark_dirty(self.rect)
 
     
     def reset_position(self):
@@ -158,39 +167,23 @@ class SoilUpgrade:
             target_soil.is_clover = False
             target_soil.is_holy = False
             target_soil.upgraded_color = None
-        play_sound_with_pitch("music/sound_effects/soil-upgrade.wav", 1.0 + random.uniform(-0.2,0.2))
+        play_effect("soil-upgrade", 1.0 + random.uniform(-0.2,0.2))
         target_soil.spawn_particles(12, (0, 120, 255, 180))
 
 
     def update_hoover_screen(self , mouse_pos):
-        self.is_hovered = self.rect.collidepoint(mouse_pos)
+        is_hovered = self.rect.collidepoint(mouse_pos)
+        if is_hovered != self.is_hovered:
+            mark_dirty(self.popup_rect(pygame.display.get_surface().get_width()))
+        self.is_hovered = is_hovered
+
+    def popup_rect(self, screen_width: int) -> pygame.Rect:
+        """Where the hover popup is drawn, kept on screen horizontally."""
+        return tooltip_rect(self.rect, self.name, self.description, screen_width)
 
     def draw_popup_pos(self , screen):
         if self.is_hovered:
-            
-            name_surface = self.popup_font.render(self.name, True, (255, 255, 0))
-            desc_surface = self.popup_font.render(self.description, True, (255, 255, 255))
-
-            padding = 5
-            spacing = 2 
-
-            popup_width = max(name_surface.get_width(), desc_surface.get_width()) + 2 * padding
-            popup_height = name_surface.get_height() + spacing + desc_surface.get_height() + 2 * padding
-
-            popup_x = self.rect.centerx - popup_width // 2
-            popup_y = self.rect.top - popup_height - 5
-
-            if popup_x < 0:
-                popup_x = 0
-            if popup_x + popup_width > screen.get_width():
-                popup_x = screen.get_width() - popup_width
-
-            popup_rect = pygame.Rect(popup_x, popup_y, popup_width, popup_height)
-            pygame.draw.rect(screen, (30, 30, 30), popup_rect, border_radius=5)
-            pygame.draw.rect(screen, (100, 100, 100), popup_rect, 1, border_radius=5)
-
-            screen.blit(name_surface, (popup_x + padding, popup_y + padding))
-            screen.blit(desc_surface, (popup_x + padding, popup_y + padding + name_surface.get_height() + spacing))
+            draw_tooltip(screen, self.rect, self.name, self.description)
 
     def start_shaking(self, duration: int, intensity: int):
         """Starts the shaking effect on the soil."""
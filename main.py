@@ -1,6 +1,18 @@
 # main.py
-import pygame
+from game_helpers.startup_trace import startup_trace
+import os
 import sys
+from functools import partial
+
+FAST_START = "--fast-start" in sys.argv or os.environ.get("PLANTBAY_FAST_START") == "1"
+UNCAPPED = "--uncapped" in sys.argv or os.environ.get("PLANTBAY_UNCAPPED") == "1" # draw as fast as possible, e.g. for benchmarks
+if "--startup-trace" in sys.argv:
+    startup_trace.enabled = True
+if FAST_START:
+    from game_helpers.fast_start import import_pygame_deferred
+    import_pygame_deferred()
+
+import pygame
 # Import refactored components
 from game_objects.player import Player
 from game_helpers.button import Button
@@ -17,12 +29,37 @@ from scenes.options_scene import Options_scene
 # Import game logic and initialization helpers
 from game_helpers.game_logic import GameRoundManager
 from game_helpers.game_initializer import GameInitializer
+from game_helpers.sound_with_pith import play_ready_sounds, sounds_pending
+from game_effects.particles import particle_engine
+from game_helpers.audio_manager import MusicPlayer, ensure_mixer, get_audio_manifest, preload_sound_effect
+from game_helpers.asset_cache import load_image, image_cache
+from game_helpers.texture_atlas import read_default_atlas, install_default_atlas
+from game_helpers.asset_loader import AssetLoader
+from game_helpers.asset_pack import AssetPack
+from game_helpers.game_initializer import SOIL_SIZE
+from game_helpers.scene_manager import SceneManager
+from game_helpers.text_cache import get_font
+from game_helpers.dirty_rects import dirty_rects
+from game_helpers.frame_profiler import frame_profiler
+from game_helpers.perf_counters import perf_counters
+from game_helpers.compositor import LAYER_UI, LAYER_DRAG
+from game_helpers.render_queue import render_queue
+
+if "--dirty-rects" in sys.argv:
+    dirty_rects.enabled = True
+if "--perf-counters" in sys.argv:
+    perf_counters.enable()
+
+startup_trace.mark("imports")
 
 # --- Global Constants ---
 SCREEN_WIDTH = 832
 SCREEN_HEIGHT = 640
 GAME_TITLE = "Plant Bay"
 FPS = 60
+SIMULATION_STEP_MS = 1000 / 60 # game logic always advances in steps of this length
+MAX_STEPS_PER_FRAME = 5 # catch-up cap; time beyond it is dropped instead of simulated
+IDLE_WAIT_MS = 500 # longest an idle frame blocks waiting for input before updating again
 BG_COLOR = (0, 128, 0)
 TEXT_COLOR = (255, 255, 255)
 BUTTON_COLOR = (50, 150, 50)
@@ -31,9 +68,6 @@ BUTTON_HOVER_COLOR = (70, 170, 70)
 
 COINS_PER_ROUND = 50
 
-MUSIC_PATH = "music/Pixel Garden Theme (Remix).mp3"
-MUSIC_VOLUME = 0.1
-
 #--- Game State Constants---
 GAME_STATE_PLAYING = "PLAYING"
 GAME_STATE_SHOP = "SHOP"
@@ -43,15 +77,39 @@ GAME_STATE_ROUND_WON = "ROUND WON"
 GAME_STATE_STARTING_SCREEN = "STARTING SCREEN"
 GAME_STATE_OPTIONS = "OPTIONS"
 
+#--- Asset Loader Groups ---
+PLAYING_ASSETS = "playing" # everything needed before the Play button is enabled
+MENU_ASSETS = "menu"
+
 class Game:
-    def __init__(self):
-        pygame.init()
-        pygame.mixer.init()
+    def __init__(self, fast_start: bool = FAST_START):
+        """
+        Args:
+            fast_start (bool): Only initialise the display and fonts before the first frame and
+                keep numpy out of the pygame import; the mixer is started by the asset loader.
+        """
+        self.fast_start = fast_start
+        if fast_start:
+            pygame.display.init()
+            pygame.font.init()
+        else:
+            pygame.init()
+            pygame.mixer.init()
+        startup_trace.mark("pygame init")
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption(GAME_TITLE)
-        logo = pygame.image.load("assets/logos/logo.png")
-        pygame.display.set_icon(logo)
+        image_cache.asset_pack = AssetPack.open()
+        pygame.display.set_icon(load_image("assets/logos/logo.png", (120, 120)))
         self.clock = pygame.time.Clock()
+        self.uncapped = UNCAPPED
+        self.fixed_step = False # advance exactly one step per frame whatever the elapsed time, e.g. for benchmarks
+        self.update_accumulator = 0.0 # simulated time owed to the fixed-step loop, in ms
+        self.interpolation = 0.0 # how far the drawn frame is between the last two steps, 0..1
+        self.dropped_update_ms = 0.0
+        self.idle_frames = 0 # consecutive frames in which nothing could change without input
+        self.had_events = False
+        self.woken_event = None # event that ended an idle wait, handled first next frame
+        startup_trace.mark("display")
 
         # --- Game States ---
         self.current_game_state = GAME_STATE_STARTING_SCREEN
@@ -63,17 +121,18 @@ class Game:
         self.GAME_STATE_ROUND_WON = GAME_STATE_ROUND_WON
         self.GAME_STATE_STARTING_SCREEN = GAME_STATE_STARTING_SCREEN
         self.GAME_STATE_OPTIONS = GAME_STATE_OPTIONS
+        self.PLAYING_ASSETS = PLAYING_ASSETS
+        self.MENU_ASSETS = MENU_ASSETS
     
         # --- Fonts ---
-        self.font_welcome = pygame.font.Font(None, 36)
-        self.font_hello_botany = pygame.font.Font(None, 48)
-        self.font_score = pygame.font.Font(None, 30)
-        self.font_game_over = pygame.font.Font(None, 100)
+        self.font_welcome = get_font(36, None)
+        self.font_hello_botany = get_font(48, None)
+        self.font_score = get_font(30, None)
+        self.font_game_over = get_font(100, None)
+        self.font_debug = get_font(16, None)
 
-        # --- Music ---
-        # pygame.mixer.music.load(MUSIC_PATH)
-        # pygame.mixer.music.set_volume(MUSIC_VOLUME)
-        # pygame.mixer.music.play(-1)
+        # --- Audio ---
+        self.music_player = MusicPlayer()
 
         # --- Game Variables ---
         self.current_score = 0
@@ -82,8 +141,8 @@ class Game:
         self.round_number = 1
         self.coins_per_round = COINS_PER_ROUND
 
-        # ---Player Objects ---
-        self.player = Player(initial_seeds_count=10, initial_coins=100, inital_upgrades=1)
+        # ---Player Objects (created by _init_game_objects) ---
+        self.player = None
 
         # --- Game Objects ---
         self.soils = []
@@ -99,6 +158,7 @@ class Game:
         self.dragged_item_scale = 1.0
         self.drag_scale_target = 1.0
         self.drag_ease = 0.2
+        self.dragged_item_previous_pos = None # position before the last step, for interpolated drawing
         # --- UI Elements ---
         #Backpack
         self.backpack_icon_button = Button(
@@ -110,38 +170,115 @@ class Game:
             text_color=(255,255,255),
             font_size=1
         )
-        self.backpack_icon_button.image = pygame.image.load("assets/backpack.png").convert_alpha()
-        self.backpack_icon_button.image = pygame.transform.scale(self.backpack_icon_button.image, (80, 80))
-
-        # --- Scene Managers ---
-        self.shop_scene = ShopScene(self.screen, self , self.player, shop_item_size=(80, 80)) 
-        self.inventory_scene = InventoryScene(self.screen, self.player, self)
-        self.playing_scene = PlayingScene(self.screen, self)
-        self.lose_scene = LoseScene(self.screen, self)
-        self.round_won_scene = RoundWonScene(self , self.screen)
-        self.starting_scene = StartingScene(self.screen, self)
-        self.options_scene = Options_scene(self.screen, self)
+        self.backpack_icon_button.image = None # set once the texture atlas is installed
 
         # --- Helper Managers ---
         self.game_initializer = GameInitializer(self)
         self.round_manager = GameRoundManager(self)
 
+        # --- Asset Loader (decodes on worker threads, finishes on the main thread between frames) ---
+        self.asset_loader = AssetLoader()
+
+        # --- Scene Managers (scenes are built on first use) ---
+        self.scene_manager = SceneManager()
+        self.scene_manager.register(GAME_STATE_STARTING_SCREEN, lambda: StartingScene(self.screen, self),
+                                    persistent=False, prefetch=(GAME_STATE_PLAYING,))
+        self.scene_manager.register(GAME_STATE_OPTIONS, lambda: Options_scene(self.screen, self), persistent=False)
+        self.scene_manager.register(GAME_STATE_PLAYING, self._create_playing_scene,
+                                    prefetch=(GAME_STATE_ROUND_WON, GAME_STATE_INVENTORY))
+        self.scene_manager.register(GAME_STATE_ROUND_WON, lambda: RoundWonScene(self , self.screen), prefetch=(GAME_STATE_SHOP,))
+        self.scene_manager.register(GAME_STATE_SHOP, lambda: self.add_game_layers(ShopScene(self.screen, self , self.player, shop_item_size=(80, 80))),
+                                    prefetch=(GAME_STATE_PLAYING,))
+        self.scene_manager.register(GAME_STATE_INVENTORY, lambda: self.add_game_layers(InventoryScene(self.screen, self.player, self)))
+        self.scene_manager.register(GAME_STATE_LOSE, lambda: LoseScene(self.screen, self), persistent=False)
+        self.scene_manager.change(self.current_game_state)
+        startup_trace.mark("starting scene")
+
+        # --- Remaining startup work, finished by the loader while the starting screen runs ---
+        self.first_frame_drawn = False
+        self.asset_loader.submit(PLAYING_ASSETS, lambda: read_default_atlas(image_cache, SOIL_SIZE),
+                                 self._install_texture_atlas, "texture atlas")
+        self.asset_loader.submit(PLAYING_ASSETS, None, self._init_audio, "mixer")
+
+    def _install_texture_atlas(self, prepared_atlas: dict):
+        self.texture_atlas = install_default_atlas(image_cache, prepared_atlas)
+        self.backpack_icon_button.image = load_image("assets/backpack.png", (80, 80))
+        self.asset_loader.submit(PLAYING_ASSETS, None, self._init_game_objects, "game objects")
+
+    def _init_audio(self, _=None):
+        ensure_mixer()
+        self.music_player.play_for_scene(self.current_game_state)
+        for name in get_audio_manifest()["sound_effects"]:
+            self.asset_loader.submit(PLAYING_ASSETS, partial(preload_sound_effect, name))
+
+    def _init_game_objects(self, _=None):
+        self.player = Player(initial_seeds_count=10, initial_coins=100, inital_upgrades=1)
+
         # --- Initial Game Setup ---
         self.game_initializer.initialize_game_objects()
-        self.game_initializer.initialize_ui_elements()
 
         # --- Start First Round ---
         self.round_manager.start_new_round()
         self.round_manager.calculate_predicted_score()
 
+    def is_ready(self) -> bool:
+        """True once everything the playing scene needs has been loaded."""
+        return self.asset_loader.is_ready(PLAYING_ASSETS)
+
+    def load_progress(self) -> float:
+        return self.asset_loader.progress(PLAYING_ASSETS)
+
+    def run_startup_step(self):
+        """Finishes loaded assets for a few milliseconds; the game loop calls this once per frame while loading."""
+        self.asset_loader.pump()
+        if not self.asset_loader.busy() and self.first_frame_drawn:
+            startup_trace.finish()
+
+    def finish_startup(self):
+        """Waits for the playing-scene assets, e.g. when a scene needs them before the loader is done."""
+        self.asset_loader.wait(PLAYING_ASSETS)
+
+
+    def _create_playing_scene(self) -> PlayingScene:
+        playing_scene = PlayingScene(self.screen, self)
+        self.game_initializer.initialize_ui_elements(playing_scene)
+        return self.add_game_layers(playing_scene)
+
+    def add_game_layers(self, scene):
+        """Puts the backpack icon on the scene's UI layer and the dragged item on its drag layer."""
+        scene.compositor.add(LAYER_UI, self.backpack_icon_button.draw, lambda: self.backpack_icon_button.image)
+        scene.compositor.add(LAYER_DRAG, self.draw_dragged_item)
+        return scene
+
+    @property
+    def playing_scene(self) -> PlayingScene:
+        return self.scene_manager.get(GAME_STATE_PLAYING)
+
+    @property
+    def shop_scene(self) -> ShopScene:
+        return self.scene_manager.get(GAME_STATE_SHOP)
 
     def handle_events(self):
         """Handles all Pygame events."""
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        if self.woken_event is not None:
+            events.insert(0, self.woken_event)
+            self.woken_event = None
+        self.had_events = bool(events)
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
 
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F2 and dirty_rects.enabled:
+                dirty_rects.debug = not dirty_rects.debug
+                dirty_rects.mark_all()
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                frame_profiler.show_hud = not frame_profiler.show_hud
+                dirty_rects.mark_all()
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                frame_profiler.export_csv()
+
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 if self.backpack_icon_button.is_clicked(event.pos):
                     self.backpack_icon_button.play_click_sound()
@@ -152,20 +289,7 @@ class Game:
                         self.change_state(self.GAME_STATE_INVENTORY)
                     continue
 
-            if self.current_game_state == self.GAME_STATE_PLAYING:
-                self.playing_scene.handle_event(event)
-            elif self.current_game_state == self.GAME_STATE_SHOP:
-                self.shop_scene.handle_event(event)
-            elif self.current_game_state == self.GAME_STATE_INVENTORY:
-                self.inventory_scene.handle_event(event)
-            elif self.current_game_state == self.GAME_STATE_LOSE:
-                self.lose_scene.handle_event(event)
-            elif self.current_game_state == self.GAME_STATE_ROUND_WON:
-                self.round_won_scene.handle_event(event)
-            elif self.current_game_state == self.GAME_STATE_STARTING_SCREEN:
-                self.starting_scene.handle_event(event)
-            elif self.current_game_state == self.GAME_STATE_OPTIONS:
-                self.options_scene.handle_event(event)
+            self.scene_manager.current.handle_event(event)
 
             # --- Unified Drag & Drop Handling---
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -201,6 +325,7 @@ class Game:
                     self.drag_offset_x = 0
                     self.drag_offset_y = 0
                     self.dragged_item_target_pos = None
+                    self.dragged_item_previous_pos = None
                     self.dragged_item_scale = 1.0
                     self.drag_scale_target = 1.0
     
@@ -217,30 +342,17 @@ class Game:
 
     def update(self , dt):
         """Updates game logic based on the current game state."""
+        self.music_player.update(dt)
+        self.scene_manager.current.update(dt)
         if self.current_game_state == self.GAME_STATE_PLAYING:
-            self.playing_scene.update(dt)
             self.round_manager.calculate_predicted_score()
             self.round_manager.update()
-            for soil in self.soils:
-                soil.update(dt)
-        elif self.current_game_state == self.GAME_STATE_SHOP:
-            self.shop_scene.update(dt) 
-
-        elif self.current_game_state == self.GAME_STATE_INVENTORY:
-            self.inventory_scene.update()
-        elif self.current_game_state == self.GAME_STATE_LOSE:
-            self.lose_scene.update()
-        elif self.current_game_state == self.GAME_STATE_ROUND_WON:
-            self.round_won_scene.update(dt)
-        elif self.current_game_state == self.GAME_STATE_STARTING_SCREEN:
-            self.starting_scene.update(dt)
-        elif self.current_game_state == self.GAME_STATE_OPTIONS:
-            self.options_scene.update(dt)
 
         # --- Dragging Logic ---
         if self.dragging_item and self.dragged_item is not None and self.dragged_item_target_pos is not None:
             # Lerp position
             cur_x, cur_y = self.dragged_item.rect.x, self.dragged_item.rect.y
+            self.dragged_item_previous_pos = (cur_x, cur_y)
             target_x, target_y = self.dragged_item_target_pos
 
 
@@ -253,52 +365,184 @@ class Game:
                  self.dragged_item_scale += (self.drag_scale_target - self.dragged_item_scale) * 0.2
 
 
-    def draw(self):
-        """Draws elements on the screen based on the current game state."""
-        if self.current_game_state == self.GAME_STATE_PLAYING:
-            self.playing_scene.draw()
-            
-
-        elif self.current_game_state == self.GAME_STATE_SHOP:
-            self.shop_scene.draw()
-
-        elif self.current_game_state == self.GAME_STATE_INVENTORY:
-            self.inventory_scene.draw()
-
-        elif self.current_game_state == self.GAME_STATE_LOSE:
-            self.lose_scene.draw()
-
-        elif self.current_game_state == self.GAME_STATE_ROUND_WON:
-            self.round_won_scene.draw()
-
-        if self.current_game_state == self.GAME_STATE_STARTING_SCREEN:
-            self.starting_scene.draw()
- 
-        elif self.current_game_state == self.GAME_STATE_OPTIONS:
-            self.options_scene.draw()
-
-        if self.current_game_state in [self.GAME_STATE_PLAYING, self.GAME_STATE_SHOP ,self.GAME_STATE_INVENTORY]:
-            self.backpack_icon_button.draw(self.screen)
+    def is_idle(self) -> bool:
+        """
+        True when nothing on screen can change until the next input event: the
+        scene says so (through an optional is_idle method), there was no input
+        this frame, and no loading, dragging, music fade, sound, particle or
+        profiler HUD is active.
+        """
+        scene_is_idle = getattr(self.scene_manager.current, "is_idle", None)
+        return (scene_is_idle is not None and scene_is_idle()
+                and not self.had_events
+                and not self.dragging_item
+                and not self.asset_loader.busy()
+                and not self.music_player.is_fading()
+                and not sounds_pending()
+                and particle_engine.count == 0
+                and not frame_profiler.show_hud)
+
+    def wait_for_input(self, timeout_ms: int):
+        """Blocks until an event arrives or timeout_ms passes; the event is handled first next frame."""
+        event = pygame.event.wait(timeout_ms)
+        if event.type != pygame.NOEVENT:
+            self.woken_event = event
+
+    def advance(self, frame_ms: float):
+        """
+        Runs as many fixed SIMULATION_STEP_MS updates as the elapsed time allows,
+        at most MAX_STEPS_PER_FRAME, so game speed does not depend on the frame rate.
+
+        The dragged item and particles are drawn between the last two steps by
+        self.interpolation. Everything else is drawn at its last step: soil shake
+        is random jitter, scale easing and fades are already quantized by the
+        frame caches, and the round-won title pop-in follows the wall clock, so
+        only those can step visibly when the display rate differs from 60 Hz.
+        """
+        self.update_accumulator += frame_ms
+        steps = 0
+        while self.update_accumulator >= SIMULATION_STEP_MS and steps < MAX_STEPS_PER_FRAME:
+            self.update(SIMULATION_STEP_MS)
+            self.update_accumulator -= SIMULATION_STEP_MS
+            steps += 1
+        if self.update_accumulator >= SIMULATION_STEP_MS:
+            # Too far behind (a long load or a stalled window): skip ahead instead of spiralling
+            self.dropped_update_ms += self.update_accumulator - self.update_accumulator % SIMULATION_STEP_MS
+            self.update_accumulator %= SIMULATION_STEP_MS
+        self.interpolation = self.update_accumulator / SIMULATION_STEP_MS
+        particle_engine.interpolation = self.interpolation
+
+    def interpolate_dragged_item(self) -> tuple[int, int] | None:
+        """
+        Moves the dragged item to where it is between the last two steps for drawing.
+
+        Returns:
+            tuple[int, int] | None: The simulated position to restore after drawing, None if nothing moved.
+        """
+        if not self.dragging_item or self.dragged_item is None or self.dragged_item_previous_pos is None:
+            return None
+        simulated = self.dragged_item.rect.topleft
+        previous = self.dragged_item_previous_pos
+        # Drawn one step behind the simulation, blended by the time already owed to the next step
+        self.dragged_item.rect.topleft = (
+            round(previous[0] + (simulated[0] - previous[0]) * self.interpolation),
+            round(previous[1] + (simulated[1] - previous[1]) * self.interpolation),
+        )
+        return simulated
 
+    def draw(self):
+        """
+        Draws elements on the screen based on the current game state.
+
+        In dirty-rect mode, scenes that support it are redrawn only inside the
+        regions marked since the last frame, and only those regions are pushed
+        to the display. F2 toggles an overlay outlining them, F3 the frame
+        profiler HUD.
+        """
+        scene = self.scene_manager.current
+        simulated_pos = self.interpolate_dragged_item()
+        if not dirty_rects.enabled:
+            self.draw_scene(scene)
+            frame_profiler.lap("draw")
+            pygame.display.flip()
+        else:
+            self.draw_dirty(scene)
+        if simulated_pos is not None:
+            self.dragged_item.rect.topleft = simulated_pos
+
+        if not self.first_frame_drawn:
+            self.first_frame_drawn = True
+            startup_trace.mark("first frame")
+            if not self.asset_loader.busy():
+                startup_trace.finish()
+
+
+    def draw_scene(self, scene):
+        # Every scene draws through the render queue: its blits are drawn in order, one blits call per layer
+        render_queue.begin(self.screen)
+        scene.draw()
+        # Scenes with a compositor draw the backpack and dragged item as layers, see add_game_layers
+        if getattr(scene, "compositor", None) is None:
+            if self.current_game_state in [self.GAME_STATE_PLAYING, self.GAME_STATE_SHOP ,self.GAME_STATE_INVENTORY]:
+                self.backpack_icon_button.draw(self.screen)
+
+            self.draw_dragged_item(self.screen)
+        render_queue.flush()
+
+        if frame_profiler.show_hud:
+            frame_profiler.draw_hud(self.screen, self.font_debug)
+
+    def draw_dragged_item(self, surface: pygame.Surface):
         if self.dragged_item is not None and self.dragging_item:
-            self.dragged_item.draw(self.screen)
-
-
-        pygame.display.flip()
-
+            self.dragged_item.draw(surface)
+
+    def draw_dirty(self, scene):
+        screen_rect = self.screen.get_rect()
+        if frame_profiler.show_hud:
+            dirty_rects.mark(frame_profiler.hud_rect(screen_rect))
+        rects = dirty_rects.take(screen_rect)
+        # A dragged item does not report its rects, so frames with one are drawn in full
+        if not getattr(scene, "supports_dirty_rects", False) or self.dragging_item:
+            rects = None
+            dirty_rects.mark_all()
+
+        if rects is None:
+            self.draw_scene(scene)
+        elif rects:
+            # Everything is drawn clipped to the union; only the rects themselves are pushed
+            self.screen.set_clip(rects[0].unionall(rects[1:]))
+            self.draw_scene(scene)
+            self.screen.set_clip(None)
+        dirty_rects.record(rects, screen_rect)
+
+        overlay_rects = dirty_rects.draw_debug(self.screen, rects, self.font_debug) if dirty_rects.debug else []
+        frame_profiler.lap("draw")
+        if rects is None:
+            pygame.display.flip()
+        elif rects or overlay_rects:
+            pygame.display.update(rects + overlay_rects)
 
     def change_state(self, new_state: str):
         """Changes the current game state."""
+        if new_state not in (self.GAME_STATE_STARTING_SCREEN, self.GAME_STATE_OPTIONS):
+            self.finish_startup()
         self.current_game_state = new_state
+        self.scene_manager.change(new_state)
+        dirty_rects.mark_all()
+        self.music_player.play_for_scene(new_state)
 
     def run(self):
         """Main game loop."""
         while True:
-            dt = self.clock.tick(60)
-            self.handle_events()
-            self.update(dt)
+            self.run_frame()
+
+    def run_frame(self):
+        """One iteration of the game loop: wait, events, fixed-step updates, draw and background work."""
+        frame_profiler.begin_frame(self.current_game_state)
+        frame_ms = self.clock.tick(0 if self.uncapped else FPS)
+        if self.idle_frames:
+            # The screen already shows the settled state; sleep until something happens. Nothing was
+            # animating, so the time spent asleep does not need to be simulated.
+            self.wait_for_input(IDLE_WAIT_MS)
+            frame_ms = min(frame_ms + self.clock.tick(), SIMULATION_STEP_MS)
+        frame_profiler.lap("wait")
+        self.handle_events()
+        frame_profiler.lap("events")
+        self.advance(SIMULATION_STEP_MS if self.fixed_step else frame_ms)
+        frame_profiler.lap("update")
+        # Uncapped runs measure drawing, so they draw every frame
+        self.idle_frames = self.idle_frames + 1 if not self.uncapped and self.is_idle() else 0
+        if self.idle_frames <= 1:
             self.draw()
-            self.clock.tick(FPS)
+        frame_profiler.lap("present")
+        play_ready_sounds()
+        if self.asset_loader.busy():
+            self.run_startup_step()
+        else:
+            self.scene_manager.prefetch_next()
+        frame_profiler.lap("loader")
+        frame_profiler.end_frame()
+        perf_counters.end_frame(self.current_game_state)
 
 # --- Main execution block ---
 if __name__ == "__main__":
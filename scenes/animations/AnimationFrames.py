@@ -0,0 +1,54 @@
+import pygame
+from game_helpers.render_queue import queue_blit
+
+ALPHA_LEVELS = 64 # distinct fade levels, alpha is rounded to the nearest one
+TITLE_SCALE_STEP = 0.02
+
+
+class AlphaFrames:
+    """
+    Full-screen translucent fill with precomputed alpha levels. One opaque
+    surface is filled once; drawing only switches its surface alpha to the
+    nearest level, so fades allocate and fill nothing per frame.
+    """
+    def __init__(self, width: int, height: int, color: tuple, levels: int = ALPHA_LEVELS):
+        self.surface = pygame.Surface((width, height))
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert()
+        self.surface.fill(color[:3])
+        self.levels = [round(255 * index / levels) for index in range(levels + 1)]
+        self.current_level = None
+
+    def level_for(self, alpha: float) -> int:
+        index = round(max(0.0, min(255.0, alpha)) * (len(self.levels) - 1) / 255)
+        return self.levels[index]
+
+    def draw(self, screen: pygame.Surface, alpha: float):
+        level = self.level_for(alpha)
+        if level == 0:
+            return
+        if level != self.current_level:
+            self.surface.set_alpha(level)
+            self.current_level = level
+        queue_blit(screen, self.surface, (0, 0))
+
+
+class ScaleFrames:
+    """
+    Scaled copies of one surface from min_scale to max_scale, built once.
+    get() returns the frame nearest to a scale, so pulsing titles never
+    call transform.scale at draw time.
+    """
+    def __init__(self, image: pygame.Surface, min_scale: float, max_scale: float, step: float = TITLE_SCALE_STEP):
+        self.min_scale = min_scale
+        self.step = step
+        self.frames = []
+        count = round((max_scale - min_scale) / step) + 1
+        for index in range(count):
+            scale = min_scale + index * step
+            size = (int(image.get_width() * scale), int(image.get_height() * scale))
+            self.frames.append(pygame.transform.scale(image, size))
+
+    def get(self, scale: float) -> pygame.Surface:
+        index = round((scale - self.min_scale) / self.step)
+        return self.frames[max(0, min(len(self.frames) - 1, index))]
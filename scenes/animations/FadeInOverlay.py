@@ -1,8 +1,9 @@
 import pygame
+from scenes.animations.AnimationFrames import AlphaFrames
 
 class FaseInOverlay:
     def __init__(self, width, height, color=(0, 0, 0), max_alpha=180, fade_speed=3):
-        self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.frames = AlphaFrames(width, height, color)
         self.base_color = color
         self.max_alpha = max_alpha
         self.fade_speed = fade_speed
@@ -15,6 +16,8 @@ class FaseInOverlay:
         if self.alpha < self.max_alpha:
             self.alpha = min(self.max_alpha, self.alpha + self.fade_speed * (dt / 16))
 
+    def is_finished(self) -> bool:
+        return self.alpha >= self.max_alpha
+
     def draw(self, screen):
-        self.surface.fill((*self.base_color, int(self.alpha)))
-        screen.blit(self.surface, (0, 0))
\ No newline at end of file
+        self.frames.draw(screen, self.alpha)
\ No newline at end of file
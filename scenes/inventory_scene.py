@@ -4,21 +4,26 @@ from game_objects.seed import Seed
 from game_helpers.button import Button
 from game_objects.soil_upgrade import SoilUpgrade
 from game_helpers.tilemap_generator import TilemapGenerator
+from game_helpers.asset_cache import load_image
 from tilesets.background_tileset import TILE_SIZE, Backpack_tiles, BACKPACK_MAP , test_tiles
+from game_helpers.text_cache import get_font, render_text
+from game_helpers.compositor import Compositor, LAYER_BACKGROUND, LAYER_BOARD, STATIC
+from game_helpers.render_queue import queue_blit
 
 class InventoryScene:
+    supports_dirty_rects = True # items report position and hover changes, see game_helpers.dirty_rects
+
     def __init__(self , screen:pygame.Surface, player: Player , game_manager):
         self.screen = screen
         self.game_manager = game_manager
         self.player = player
 
         self.background_color = (50,50,80,200)
-        self.font_title = pygame.font.Font("assets/fonts/pixelFont.ttf", 60)
-        self.font_item = pygame.font.Font("assets/fonts/pixelFont.ttf", 24)
+        self.font_title = get_font(60)
+        self.font_item = get_font(24)
         self.close_button_text_color = (255, 255, 255)
 
-        self.coin_image = pygame.image.load("assets/animated_coins.png").convert_alpha()
-        self.coin_image = pygame.transform.scale(self.coin_image, (30, 30))
+        self.coin_image = load_image("assets/animated_coins.png", (30, 30))
 
         self.grid_start_x = 100
         self.grid_start_y = 150
@@ -30,12 +35,17 @@ class InventoryScene:
         self.seeds = self.game_manager.player.get_backpack_seeds()
 
         self.tilemap = TilemapGenerator(BACKPACK_MAP, TILE_SIZE, Backpack_tiles)
+
+        #--- Layers ---
+        self.compositor = Compositor()
+        self.build_layers()
+
     def handle_event(self, event:pygame.event.Event):
         """Handle events for the inventory scene."""
         pass
 
 
-    def update(self):
+    def update(self, dt):
         mouse_pos = pygame.mouse.get_pos()
         for seed in self.seeds:
             seed.update_hoover_screen(mouse_pos)
@@ -45,19 +55,33 @@ class InventoryScene:
 
 
 
+    def is_idle(self) -> bool:
+        """Items only change on hover, which always comes with an input event."""
+        return True
+
+    def build_layers(self):
+        """The tiles and title are drawn once; items move with the backpack contents and are drawn every frame."""
+        self.compositor.set_mode(LAYER_BACKGROUND, STATIC, opaque=True)
+        self.compositor.add(LAYER_BACKGROUND, self.draw_background)
+        self.compositor.add(LAYER_BOARD, self.draw_items)
+
     def draw(self):
         """Draw the inventory scene."""
-        self.tilemap.draw(self.screen)
+        self.compositor.draw(self.screen)
+
+    def draw_background(self, surface: pygame.Surface):
+        self.tilemap.draw(surface)
 
         # Draw title
-        title_surface = self.font_title.render("Backpack Inventory", True, (255, 255, 255))
-        title_rect = title_surface.get_rect(center=(self.screen.get_width() // 2, 80))
-        self.screen.blit(title_surface, title_rect)
+        title_surface = render_text(self.font_title, "Backpack Inventory", (255, 255, 255))
+        title_rect = title_surface.get_rect(center=(surface.get_width() // 2, 80))
+        queue_blit(surface, title_surface, title_rect)
 
         # --- Display Seeds ---
-        seeds_label = self.font_item.render("Seeds:", True, (255, 255, 255))
-        self.screen.blit(seeds_label, (50, 150))
+        seeds_label = render_text(self.font_item, "Seeds:", (255, 255, 255))
+        queue_blit(surface, seeds_label, (50, 150))
 
+    def draw_items(self, surface: pygame.Surface):
         seed_x_start = 50
         seed_y_start = 190
         x_offset = self.item_slot_size + 10 # Spacing
@@ -65,11 +89,11 @@ class InventoryScene:
 
         current_x = seed_x_start
         current_y = seed_y_start
-        max_items_per_row = (self.screen.get_width() - seed_x_start * 2) // x_offset
+        max_items_per_row = (surface.get_width() - seed_x_start * 2) // x_offset
 
         for i, seed in enumerate(self.game_manager.player.get_backpack_seeds()):
             seed.update_position(current_x, current_y)
-            seed.draw(self.screen)
+            seed.draw(surface)
 
             current_x += x_offset
             if (i + 1) % max_items_per_row == 0:
@@ -77,17 +101,17 @@ class InventoryScene:
                 current_y += y_offset
 
         # --- Display Upgrades ---
-        upgrades_label = self.font_item.render("Upgrades:", True, (255, 255, 255))
+        upgrades_label = render_text(self.font_item, "Upgrades:", (255, 255, 255))
 
         upgrades_y_start = current_y + y_offset + 30 if self.game_manager.player.get_backpack_seed_count() > 0 else seed_y_start + y_offset + 30
-        self.screen.blit(upgrades_label, (50, upgrades_y_start))
+        queue_blit(surface, upgrades_label, (50, upgrades_y_start))
 
         current_x = seed_x_start
         current_y = upgrades_y_start + 40
 
         for i, upgrade in enumerate(self.game_manager.player.get_backpack_upgrades()):
             upgrade.update_position(current_x, current_y)
-            upgrade.draw(self.screen) # Draw the upgrade image and name
+            upgrade.draw(surface) # Draw the upgrade image and name
 
             current_x += x_offset
             if (i + 1) % max_items_per_row == 0:
@@ -1,5 +1,7 @@
 # scenes/lose_scene.py
 import pygame
+from game_helpers.text_cache import get_font, render_text
+from game_helpers.render_queue import queue_blit
 
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
@@ -14,26 +16,30 @@ class LoseScene:
         self.game_manager = game_manager
 
         # Fonts
-        self.font_game_over = pygame.font.Font(None, 100)
-        self.font_score = pygame.font.Font(None, 30)
+        self.font_game_over = get_font(100, None)
+        self.font_score = get_font(30, None)
 
     def handle_event(self, event):
         """Handles events specific to the lose scene (currently nothing actionable like a retry button)."""
         pass
 
-    def update(self):
+    def update(self, dt):
         """Updates logic for the lose scene."""
         pass # No dynamic updates for lose screen currently
 
+    def is_idle(self):
+        """The lose screen never changes on its own, so the game loop may stop redrawing it."""
+        return True
+
     def draw(self):
         """Draws the game over/lose screen."""
         self.screen.fill((0, 0, 0)) # Black background for game over
 
-        game_over_text = self.font_game_over.render("GAME OVER!", True, (255, 0, 0))
+        game_over_text = render_text(self.font_game_over, "GAME OVER!", (255, 0, 0))
         game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 30))
-        self.screen.blit(game_over_text, game_over_rect)
+        queue_blit(self.screen, game_over_text, game_over_rect)
 
         # Use game_manager.current_score for final score
-        final_score_text = self.font_score.render(f"Final Score: {self.game_manager.current_score}", True, TEXT_COLOR)
+        final_score_text = render_text(self.font_score, f"Final Score: {self.game_manager.current_score}", TEXT_COLOR)
         final_score_rect = final_score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30))
-        self.screen.blit(final_score_text, final_score_rect)
\ No newline at end of file
+        queue_blit(self.screen, final_score_text, final_score_rect)
\ No newline at end of file
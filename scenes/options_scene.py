@@ -2,6 +2,9 @@ import pygame
 from game_helpers.button import Button
 from game_helpers.sound_with_pith import play_sound_with_pitch
 from scenes.animations.FadeInOverlay import FaseInOverlay
+from game_helpers.text_cache import get_font, render_text
+from game_helpers.render_queue import queue_blit
+from game_helpers.frame_cache import panel_frame
 
 
 class Options_scene:
@@ -10,6 +13,8 @@ class Options_scene:
         self.game_manager = game_manager
         self.music_volume = 1.0
         self.sound_effects_volume = 1.0
+        self.font_title = get_font(32)
+        self.font_text = get_font(16)
         self.cancel_button = Button((self.screen.get_width() - 100) // 2,(self.screen.get_height())//2 + 110,100 ,30, "cancel" , (135, 148, 138) , (86, 94, 88) , (255,255,255), 24)
         self.save_button = Button((self.screen.get_width() - 100) // 2,(self.screen.get_height()+20)//2 + 60,100 ,30, "save" , (34, 140, 21) ,(24, 92, 16), (255,255,255) , 24)
     
@@ -18,6 +23,7 @@ class Options_scene:
 
     def change_music_volume(self, volume):
         self.music_volume = volume
+        self.game_manager.music_player.set_volume(volume)
 
     def change_sound_effects_volume(self, volume):
         self.sound_effects_volume = volume
@@ -30,6 +36,10 @@ class Options_scene:
         self.save_button.is_hovered = self.save_button.rect.collidepoint(mouse_pos)
 
 
+    def is_idle(self) -> bool:
+        """Nothing changes without input once the fade is done."""
+        return self.fadeInOverlayAnimation.is_finished()
+
     def draw(self):
         self.fadeInOverlayAnimation.draw(self.screen)
 
@@ -39,24 +49,21 @@ class Options_scene:
         popup_x = (self.screen.get_width() - popup_width) // 2
         popup_y = (self.screen.get_height() - popup_height) // 2
         popup_rect = pygame.Rect(popup_x, popup_y, popup_width, popup_height)
-        pygame.draw.rect(self.screen, (30, 30, 50), popup_rect, border_radius=10)
-        pygame.draw.rect(self.screen, (60, 60, 90), popup_rect, 3, border_radius=10)
+        queue_blit(self.screen, panel_frame(popup_rect.size, (30, 30, 50), (60, 60, 90)), popup_rect)
 
         # Title
-        font_title = pygame.font.Font('assets/fonts/pixelFont.ttf', 32)
-        title_surface = font_title.render("Options", True, (255, 255, 255))
+        title_surface = render_text(self.font_title, "Options", (255, 255, 255))
         title_rect = title_surface.get_rect(center=(self.screen.get_width() // 2, popup_y + 50))
-        self.screen.blit(title_surface, title_rect)
+        queue_blit(self.screen, title_surface, title_rect)
 
         #sound
-        font_text = pygame.font.Font('assets/fonts/pixelFont.ttf', 16)
-        sound_surface = font_text.render("sound volume" , True , (255,255,255))
+        sound_surface = render_text(self.font_text, "sound volume", (255,255,255))
         sound_surface_rect = sound_surface.get_rect(center=(self.screen.get_width()//2 , popup_y+ 120) )
-        self.screen.blit(sound_surface,sound_surface_rect)
+        queue_blit(self.screen, sound_surface,sound_surface_rect)
                 
-        sound_effects_surface = font_text.render("sound effects volume" , True , (255,255,255))
+        sound_effects_surface = render_text(self.font_text, "sound effects volume", (255,255,255))
         sound_effects_surface_rect = sound_surface.get_rect(center=(self.screen.get_width()//2 - 35 , popup_y+ 180) )
-        self.screen.blit(sound_effects_surface,sound_effects_surface_rect)
+        queue_blit(self.screen, sound_effects_surface,sound_effects_surface_rect)
 
         # Draw buttons
         self.cancel_button.draw(self.screen)
@@ -3,7 +3,12 @@ import pygame
 from game_helpers.button import Button
 from game_objects.soil import Soil
 from game_helpers.tilemap_generator import TilemapGenerator
+from game_helpers.asset_cache import load_image
 from tilesets.background_tileset import TILE_SIZE , Main_tiles, GAME_MAP 
+from game_helpers.text_cache import get_font, render_text
+from game_helpers.render_queue import queue_blit
+from game_effects.particles import particle_engine
+from game_helpers.compositor import Compositor, LAYER_BACKGROUND, LAYER_BOARD, LAYER_HAND, LAYER_UI, STATIC, CACHED
 
 TEXT_COLOR = (255, 255, 255)
 BG_COLOR = (0, 128, 0)
@@ -20,11 +25,14 @@ class PlayingScene:
         self.play_hand_button = None
 
         # Fonts (can be passed from game_manager or defined here if specific)
-        self.font_score = pygame.font.Font("assets/fonts/pixelFont.ttf", 30)
+        self.font_score = get_font(30)
 
         #---coin ---
-        self.coin_image = pygame.image.load("assets/animated_coins.png").convert_alpha()
-        self.coin_image = pygame.transform.scale(self.coin_image, (30, 30))
+        self.coin_image = load_image("assets/animated_coins.png", (30, 30))
+
+        #--- Layers ---
+        self.compositor = Compositor()
+        self.build_layers()
 
 
     def handle_event(self, event):
@@ -39,7 +47,8 @@ class PlayingScene:
         self.play_hand_button.is_hovered = self.play_hand_button.rect.collidepoint(mouse_pos)
         self.play_hand_button.update(dt)
         for soil in self.game_manager.soils:
-            soil.update(self.game_manager.clock.get_time())
+            soil.update(dt)
+        particle_engine.update()
 
         # --- Item Popup ---
         for seed in self.game_manager.seeds_in_hand:
@@ -49,39 +58,59 @@ class PlayingScene:
             soil.update_hoover_screen(mouse_pos)
 
 
+    def on_exit(self, next_state):
+        # Particles are only simulated and drawn here; left alive they would be frozen and keep the game from idling
+        particle_engine.clear()
+
+    def build_layers(self):
+        """Background tiles never change and the labels only change with the numbers they show."""
+        self.compositor.set_mode(LAYER_BACKGROUND, STATIC, opaque=True)
+        self.compositor.set_mode(LAYER_UI, CACHED)
+        self.compositor.add(LAYER_BACKGROUND, self.tilemap_generator.draw)
+        self.compositor.add(LAYER_BOARD, self.draw_board)
+        self.compositor.add(LAYER_HAND, self.draw_hand)
+        self.compositor.add(LAYER_UI, self.draw_ui, self.ui_signature)
+
     def draw(self):
         """Draws elements specific to the PLAYING state."""
-        self.tilemap_generator.draw(self.screen)
-
+        self.compositor.draw(self.screen)
 
+    def draw_board(self, surface: pygame.Surface):
         # Draw soil plots
         for soil in self.game_manager.soils:
-            soil.draw(self.screen)
+            soil.draw(surface)
+        particle_engine.draw(surface)
 
+    def draw_hand(self, surface: pygame.Surface):
         # Draw seeds in hand
         for seed in self.game_manager.seeds_in_hand:
-            seed.draw(self.screen)
+            seed.draw(surface)
+
+    def ui_signature(self) -> tuple:
+        button = self.play_hand_button
+        return (self.game_manager.score_goal, self.game_manager.current_score, self.game_manager.predicted_score,
+                self.game_manager.player.get_coins(), button and (button.is_hovered, button.enabled))
 
+    def draw_ui(self, surface: pygame.Surface):
         # Draw UI elements
         if self.play_hand_button:
-            self.play_hand_button.draw(self.screen)
+            self.play_hand_button.draw(surface)
 
         # Draw Score Goal
-        score_goal_text = self.font_score.render(f"Goal: {self.game_manager.score_goal}", True, TEXT_COLOR)
-        self.screen.blit(score_goal_text, (30, self.screen.get_height() // 2 - 50))
+        score_goal_text = render_text(self.font_score, f"Goal: {self.game_manager.score_goal}", TEXT_COLOR)
+        queue_blit(surface, score_goal_text, (30, surface.get_height() // 2 - 50))
 
         # Draw Current Score
-        current_score_text = self.font_score.render(f"Score: {self.game_manager.current_score}", True, TEXT_COLOR)
-        self.screen.blit(current_score_text, (30, self.screen.get_height() // 2))
+        current_score_text = render_text(self.font_score, f"Score: {self.game_manager.current_score}", TEXT_COLOR)
+        queue_blit(surface, current_score_text, (30, surface.get_height() // 2))
 
         # Draw Predicted Score
-        predicted_score_text = self.font_score.render(f"Predicted: {self.game_manager.predicted_score}", True, TEXT_COLOR)
-        self.screen.blit(predicted_score_text, (30, self.screen.get_height() // 2 + 30))
+        predicted_score_text = render_text(self.font_score, f"Predicted: {self.game_manager.predicted_score}", TEXT_COLOR)
+        queue_blit(surface, predicted_score_text, (30, surface.get_height() // 2 + 30))
 
         # Draw coins
         coin_x =  30
-        coin_y = self.screen.get_height() //2 -100
-        self.screen.blit(self.coin_image, (coin_x, coin_y))
-        coins_text = self.font_score.render(f"x {self.game_manager.player.get_coins()}", True, (255, 255, 0))
-        self.screen.blit(coins_text, (coin_x +50, coin_y  + 5))
-
+        coin_y = surface.get_height() //2 -100
+        queue_blit(surface, self.coin_image, (coin_x, coin_y))
+        coins_text = render_text(self.font_score, f"x {self.game_manager.player.get_coins()}", (255, 255, 0))
+        queue_blit(surface, coins_text, (coin_x +50, coin_y  + 5))
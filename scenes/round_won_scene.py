@@ -1,5 +1,10 @@
 import pygame
 from game_helpers.button import Button
+from game_helpers.text_cache import get_font, render_text
+from game_helpers.render_queue import queue_blit
+from game_helpers.frame_cache import panel_frame
+from scenes.animations.FadeInOverlay import FaseInOverlay
+from scenes.animations.AnimationFrames import ScaleFrames
 
 SCREEN_WIDTH = 832
 SCREEN_HEIGHT = 640
@@ -10,8 +15,8 @@ class RoundWonScene():
         self.game_manager = game_manager;
         self.screen = screen
 
-        self.font_title = pygame.font.Font('assets/fonts/pixelFont.ttf' , 24)
-        self.font_text = pygame.font.Font('assets/fonts/pixelFont.ttf' , 20)
+        self.font_title = get_font(24)
+        self.font_text = get_font(20)
 
         # Popup dimensions
         self.popup_width = SCREEN_WIDTH * 0.6
@@ -20,13 +25,12 @@ class RoundWonScene():
         self.popup_y = (SCREEN_HEIGHT - self.popup_height) // 2
         self.popup_rect = pygame.Rect(self.popup_x, self.popup_y, self.popup_width, self.popup_height)
 
-        # Popup background (for fade-in)
-        self.overlay_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        self.overlay_color = (61, 189, 42, 0) # Start fully transparent
-
         # Animation properties
         self.fade_speed = 3 # Alpha units per frame (adjust for slower/faster)
         self.max_alpha = 150 # Max transparency for overlay (0-255)
+
+        # Popup background (for fade-in), starts fully transparent
+        self.overlay = FaseInOverlay(SCREEN_WIDTH, SCREEN_HEIGHT, (61, 189, 42), self.max_alpha, self.fade_speed)
         self.title_scale = 0.7 # Start small for pop-in effect
         self.title_scale_speed = 0.01 # How fast title scales in
         self.title_max_scale = 1.2 # Max scale for bounce
@@ -35,6 +39,9 @@ class RoundWonScene():
         self.animation_duration = 1000 # Total duration for initial pop-in (milliseconds)
         self.start_animation_time = pygame.time.get_ticks()
 
+        # "Round Won!" title, pre-scaled for every step of the pop-in and pulse
+        self.title_frames = ScaleFrames(render_text(self.font_title, "Round Won!", (50,150,50)), 0.5, self.title_max_scale)
+
         #shop button
         button_width = 150
         button_height = 50
@@ -45,8 +52,11 @@ class RoundWonScene():
             "Go to Shop", (50,150,50), (70, 170, 70), (255,255,255), 20,
         )
 
+    def on_enter(self, previous_state):
+        self.reset_animation()
+
     def reset_animation(self):
-        self.overlay_color = (0, 0, 0, 0)
+        self.overlay.reset()
         self.title_scale = 0.5
         self.is_scaling_up = True
         self.start_animation_time = pygame.time.get_ticks()
@@ -65,10 +75,7 @@ class RoundWonScene():
         self.go_to_shop_button.is_hovered = self.go_to_shop_button.rect.collidepoint(mouse_pos)
 
         # Fade-in overlay
-        current_alpha = self.overlay_color[3]
-        if current_alpha < self.max_alpha:
-            new_alpha = min(self.max_alpha, current_alpha + self.fade_speed * (dt / 16)) # Scale by dt for smooth fade
-            self.overlay_color = (self.overlay_color[0], self.overlay_color[1], self.overlay_color[2], int(new_alpha))
+        self.overlay.update(dt)
 
         # Title Pop-in/Pulsing animation
         elapsed_time = pygame.time.get_ticks() - self.start_animation_time
@@ -92,32 +99,24 @@ class RoundWonScene():
 
     def draw(self):
         """Draws the round won popup."""
-        self.overlay_surface.fill(self.overlay_color)
-        self.screen.blit(self.overlay_surface, (0, 0))
+        self.overlay.draw(self.screen)
         
-        pygame.draw.rect(self.screen, (30, 30, 50), self.popup_rect, border_radius=10)
-        pygame.draw.rect(self.screen, (60, 60, 90), self.popup_rect, 3, border_radius=10) 
-
-        # "Round Won!" Title
-        title_text = "Round Won!"
-        title_surface_original = self.font_title.render(title_text, True, (50,150,50))
+        queue_blit(self.screen, panel_frame(self.popup_rect.size, (30, 30, 50), (60, 60, 90)), self.popup_rect)
 
-        # Scale the title surface
-        scaled_width = int(title_surface_original.get_width() * self.title_scale)
-        scaled_height = int(title_surface_original.get_height() * self.title_scale)
-        title_surface_scaled = pygame.transform.scale(title_surface_original, (scaled_width, scaled_height))
+        # "Round Won!" Title, the nearest pre-scaled frame
+        title_surface_scaled = self.title_frames.get(self.title_scale)
 
         title_rect = title_surface_scaled.get_rect(center=(SCREEN_WIDTH // 2, self.popup_y + 80))
-        self.screen.blit(title_surface_scaled, title_rect)
+        queue_blit(self.screen, title_surface_scaled, title_rect)
 
         #Score and Coins Earned
-        score_text = self.font_text.render(f"Score: {self.game_manager.current_score}", True, (255,255,255))
+        score_text = render_text(self.font_text, f"Score: {self.game_manager.current_score}", (255,255,255))
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, self.popup_y + 150))
-        self.screen.blit(score_text, score_rect)
+        queue_blit(self.screen, score_text, score_rect)
 
-        coins_earned_text = self.font_text.render(f"Coins Earned: {self.game_manager.coins_per_round}", True, (255, 255, 0))
+        coins_earned_text = render_text(self.font_text, f"Coins Earned: {self.game_manager.coins_per_round}", (255, 255, 0))
         coins_earned_rect = coins_earned_text.get_rect(center=(SCREEN_WIDTH // 2, self.popup_y + 190))
-        self.screen.blit(coins_earned_text, coins_earned_rect)
+        queue_blit(self.screen, coins_earned_text, coins_earned_rect)
 
         self.go_to_shop_button.draw(self.screen)
 
@@ -7,17 +7,24 @@ from game_objects.soil_upgrade import SoilUpgrade
 from game_helpers.tilemap_generator import TilemapGenerator
 from tilesets.background_tileset import TILE_SIZE, Shop_tiles, SHOP_MAP
 from game_helpers.json_loader import load_json_file
+from game_helpers.asset_cache import load_image
+from game_helpers.text_cache import get_font, render_text
+from game_helpers.render_queue import queue_blit
+from game_helpers.dirty_rects import dirty_rects, mark_dirty
+from game_helpers.compositor import Compositor, LAYER_BACKGROUND, LAYER_BOARD, LAYER_UI, STATIC, CACHED
 
 class ShopScene:
     """Represents the Shop scene of the game.
     Players are redirected here when they win a round.
     """
+    supports_dirty_rects = True # every change below reports its rects, see game_helpers.dirty_rects
+
     def __init__(self , screen: pygame.Surface , game_menager , player:Player , shop_item_size: tuple =(80,80)):
         self.screen = screen
         self.game_manager = game_menager
         self.player = player
-        self.font_title = pygame.font.Font("assets/fonts/pixelFont.ttf", 74)
-        self.font_text =pygame.font.Font("assets/fonts/pixelFont.ttf", 30)
+        self.font_title = get_font(74)
+        self.font_text =get_font(30)
         self.background_color = (100, 100, 150)
         self.tilemap = TilemapGenerator(SHOP_MAP, TILE_SIZE, Shop_tiles)
 
@@ -28,8 +35,9 @@ class ShopScene:
         self.roll_cost = 10
         
         #--- Coin Image ---
-        self.coin_image = pygame.image.load("assets/animated_coins.png").convert_alpha()
-        self.coin_image = pygame.transform.scale(self.coin_image, (30, 30))
+        self.coin_image = load_image("assets/animated_coins.png", (30, 30))
+        self.coin_pos = (30, self.screen.get_height() //2 -100)
+        self.shown_coins = None
 
         #--- Shop items available---
         self.available_shop_items = {
@@ -37,32 +45,37 @@ class ShopScene:
             "watering_can": {"class": SoilUpgrade, "image": "assets/upgrades/watering_can.png", "name": "Watering Can", "effect_value": 1, "base_price": 75}
         }
 
+        #--- Product data, read once instead of on every roll ---
+        self.all_seeds = load_json_file('seed_list.json')
+        self.all_upgrades = load_json_file('upgrades_list.json')
+
         #--Shop UI---
         self.next_round_button = Button(20 , self.screen.get_height() - 70 , 180 , 50 ,
                                         "Next Round", (50,150,50),(0, 200, 0) ,(255,255,255), 24)
         self.roll_button = Button(20 , self.screen.get_height() - 140 , 180 , 50 ,
-                                        "Roll", (150,50,50), (200, 80, 80),(255,255,255), 24, "music/sound_effects/money-spend.mp3")
+                                        "Roll", (150,50,50), (200, 80, 80),(255,255,255), 24, "money-spend")
         self.generate_products()
 
+        #--- Layers ---
+        self.compositor = Compositor()
+        self.build_layers()
+
 
     def generate_products(self):
         """Generates random products for the shop."""
 
         self.products_on_display.clear()
+        dirty_rects.mark_all()
         seed_y_start = self.screen.get_height() // 2 - self.shop_item_size[1] // 2 - 90
         x_padding = 50
         total_width_needed = (self.num_product_slots * self.shop_item_size[0]) + \
                              ((self.num_product_slots - 1) * x_padding)
         start_x = (self.screen.get_width() - total_width_needed) // 2
 
-        #load products
-        all_seeds = load_json_file('seed_list.json')
-        all_upgrades = load_json_file('upgrades_list.json')
-
         shop_items = []
-        for seed_data in all_seeds.values():
+        for seed_data in self.all_seeds.values():
             shop_items.append(('seed', seed_data))
-        for upgrade_data in all_upgrades.values():
+        for upgrade_data in self.all_upgrades.values():
             shop_items.append(('upgrade', upgrade_data))
 
         chosen_items = random.choices(shop_items, k=self.num_product_slots)
@@ -78,6 +91,19 @@ class ShopScene:
                 product.price = 75
 
             product.start_shaking(100 , 5)
+            buy_button_rect = self.buy_button_rect(product)
+            product.buy_button = Button(
+                buy_button_rect.x,
+                buy_button_rect.y,
+                buy_button_rect.width,
+                buy_button_rect.height,
+                f"Buy ({product.price}$)",
+                (0, 90, 0),
+                (0, 150, 0),
+                (255, 255, 255),
+                24,
+                "money-spend"
+            )
             self.products_on_display.append(product)
 
     def handle_event(self, event: pygame.event.Event):
@@ -102,6 +128,7 @@ class ShopScene:
                             print(f"Bought {product_on_display.name} for {product_on_display.price} coins.")
                             product_on_display.buy_button.play_click_sound()
                             self.products_on_display.pop(i)
+                            dirty_rects.mark_all()
                         else:
                             print("Not enough coins!")
                         break
@@ -121,50 +148,67 @@ class ShopScene:
                     self.game_manager.round_manager.next_round()
 
 
+    def build_layers(self):
+        """The tiles and title never change; the coin counter and control buttons change only on purchases and hover."""
+        self.compositor.set_mode(LAYER_BACKGROUND, STATIC, opaque=True)
+        self.compositor.set_mode(LAYER_UI, CACHED)
+        self.compositor.add(LAYER_BACKGROUND, self.draw_background)
+        self.compositor.add(LAYER_BOARD, self.draw_products)
+        self.compositor.add(LAYER_UI, self.draw_ui, self.ui_signature)
+
     def draw(self):
-        self.tilemap.draw(self.screen)
+        self.compositor.draw(self.screen)
 
-        title_surface = self.font_title.render("The Seed Shop", True, (7, 22, 105))
-        title_rect = title_surface.get_rect(center=(self.screen.get_width() // 2, 100))
-        self.screen.blit(title_surface, title_rect)
-        
-        # Draw player coin
-        coin_x =  30
-        coin_y = self.screen.get_height() //2 -100
-        self.screen.blit(self.coin_image, (coin_x, coin_y))
-        coins_text = self.font_text.render(f"x {self.game_manager.player.get_coins()}", True, (255, 255, 0))
-        self.screen.blit(coins_text, (coin_x +50, coin_y  + 5))
+    def draw_background(self, surface: pygame.Surface):
+        self.tilemap.draw(surface)
 
+        title_surface = render_text(self.font_title, "The Seed Shop", (7, 22, 105))
+        title_rect = title_surface.get_rect(center=(surface.get_width() // 2, 100))
+        queue_blit(surface, title_surface, title_rect)
+
+    def draw_products(self, surface: pygame.Surface):
         # Draw shop products
         for product in self.products_on_display:
-            product.draw(self.screen)
+            product.draw(surface)
 
-            buy_button_width = 100
-            buy_button_height = 30
-            buy_button_x = product.rect.centerx - buy_button_width // 2
-            buy_button_y = product.rect.bottom + 30
-
-            product.buy_button = Button(
-                buy_button_x,
-                buy_button_y,
-                buy_button_width,
-                buy_button_height,
-                f"Buy ({product.price}$)",
-                (0, 90, 0),
-                (0, 150, 0),
-                (255, 255, 255),
-                24,
-                "music/sound_effects/money-spend.mp3"
-            )
-            product.buy_button.draw(self.screen)
+            # The button was created with its product and only follows it while it shakes
+            product.buy_button.rect.topleft = self.buy_button_rect(product).topleft
+            product.buy_button.draw(surface)
 
+    def ui_signature(self) -> tuple:
+        return (self.game_manager.player.get_coins(), self.roll_button.is_hovered, self.next_round_button.is_hovered)
 
+    def draw_ui(self, surface: pygame.Surface):
+        # Draw player coin
+        coin_x, coin_y = self.coin_pos
+        queue_blit(surface, self.coin_image, (coin_x, coin_y))
+        coins_text = render_text(self.font_text, f"x {self.game_manager.player.get_coins()}", (255, 255, 0))
+        queue_blit(surface, coins_text, (coin_x +50, coin_y  + 5))
 
         # Draw control buttons
-        self.roll_button.draw(self.screen)
-        self.next_round_button.draw(self.screen)
+        self.roll_button.draw(surface)
+        self.next_round_button.draw(surface)
+
+    def buy_button_rect(self, product) -> pygame.Rect:
+        """The buy button sits under its product and follows it while it shakes."""
+        buy_button_width = 100
+        buy_button_height = 30
+        buy_button_x = product.rect.centerx - buy_button_width // 2
+        buy_button_y = product.rect.bottom + 30
+        return pygame.Rect(buy_button_x, buy_button_y, buy_button_width, buy_button_height)
+
+    def coins_text_rect(self, coins: int) -> pygame.Rect:
+        coins_text = render_text(self.font_text, f"x {coins}", (255, 255, 0))
+        return coins_text.get_rect(topleft=(self.coin_pos[0] + 50, self.coin_pos[1] + 5))
 
     def update(self , dt):
+        coins = self.game_manager.player.get_coins()
+        if coins != self.shown_coins:
+            if self.shown_coins is not None:
+                mark_dirty(self.coins_text_rect(self.shown_coins))
+            mark_dirty(self.coins_text_rect(coins))
+            self.shown_coins = coins
+
         buttons = [self.roll_button, self.next_round_button]
         mouse_pos = pygame.mouse.get_pos()
         for button in buttons:
@@ -173,7 +217,12 @@ class ShopScene:
         # --- Item Popup ---
         for product in self.products_on_display:
             product.update_hoover_screen(mouse_pos)
+            was_shaking = product.is_shaking
+            if was_shaking:
+                mark_dirty(self.buy_button_rect(product))
             product.update(dt)
+            if was_shaking:
+                mark_dirty(self.buy_button_rect(product))
             
         #--- buttons ---
         self.roll_button.update(dt)
@@ -1,36 +1,89 @@
 import pygame
 from game_helpers.button import Button
+from game_helpers.asset_cache import load_image, image_cache
+from game_helpers.text_cache import get_font, render_text
+from game_helpers.render_queue import queue_blit
+
+BACKGROUND_PATH = "assets/backgrounds/backgroundLogo.jpg"
+BACKGROUND_FILL_COLOR = (34, 90, 40) # shown until the background image is loaded
+PROGRESS_BAR_SIZE = (300, 10)
+PROGRESS_BAR_COLOR = (34, 140, 21)
+PROGRESS_EASE = 0.25
 
 class StartingScene:
     def __init__(self , screen:pygame.Surface, game_menager):
         self.screen = screen
         self.game_manager = game_menager
-        self.background_image = pygame.image.load("assets/backgrounds/backgroundLogo.jpg").convert_alpha()
-        self.logo_image = pygame.image.load("assets/logos/logo.png").convert_alpha()
-        self.logo_image = pygame.transform.scale(self.logo_image, (120,120))
-        self.background_image = pygame.transform.scale(self.background_image, (self.screen.get_width() , self.screen.get_height()) )
-        self.font_title = pygame.font.Font("assets/fonts/pixelFont.ttf", 74)
+        self.background_image = None
+        self.game_manager.asset_loader.load_image(game_menager.MENU_ASSETS, BACKGROUND_PATH, self.screen.get_size(),
+                                                  on_ready=self.set_background)
+        self.logo_image = load_image("assets/logos/logo.png", (120,120))
+        self.font_title = get_font(74)
+        self.font_progress = get_font(18)
+        self.shown_progress = 0.0
+        self.progress_bar = None # (filled width, surface) of the last rendered bar
         self.button = Button((self.screen.get_width()-150)//2 ,self.screen.get_height() - 150,150,50, "Play" ,(34, 140, 21) ,(24, 92, 16), (255,255,255) , 24)
         self.options_button = Button((self.screen.get_width()-120)//2 ,self.screen.get_height() - 90,120,50, "Options" , (235, 12, 30), (158, 27, 37) , (255,255,255) , 24)
         self.stats_button = Button((self.screen.get_width()-130) ,self.screen.get_height() - 60,120,50, "Stats" ,(16, 171, 199) ,(22, 129, 148), (255,255,255) , 24)
 
 
+    def set_background(self, image: pygame.Surface):
+        self.background_image = image
+
+    def on_exit(self, next_state):
+        # The full-screen background is only needed again if we come back from the options popup
+        if next_state != self.game_manager.GAME_STATE_OPTIONS:
+            image_cache.discard(BACKGROUND_PATH, self.screen.get_size())
+
+    def is_idle(self) -> bool:
+        """Idle once loading is done and the background is shown; buttons only change on input."""
+        return self.button.enabled and self.background_image is not None
+
     def draw(self):
         #background
-        self.screen.blit(self.background_image,(0,0))
+        if self.background_image is not None:
+            queue_blit(self.screen, self.background_image,(0,0))
+        else:
+            self.screen.fill(BACKGROUND_FILL_COLOR)
         #logo
         logo_rect = self.logo_image.get_rect(center=(self.screen.get_width()//2,100))
-        self.screen.blit(self.logo_image, logo_rect)
+        queue_blit(self.screen, self.logo_image, logo_rect)
         #text
-        title_surface = self.font_title.render("Plant Bay", True, (7, 22, 105))
+        title_surface = render_text(self.font_title, "Plant Bay", (7, 22, 105))
         title_rect = title_surface.get_rect(center=(self.screen.get_width() // 2, 100))
-        self.screen.blit(title_surface, title_rect)
+        queue_blit(self.screen, title_surface, title_rect)
+        #loading progress
+        if not self.button.enabled:
+            self.draw_progress()
         #buttons
         self.button.draw(self.screen)
         self.options_button.draw(self.screen)
         self.stats_button.draw(self.screen)
 
+    def draw_progress(self):
+        bar_rect = pygame.Rect((0, 0), PROGRESS_BAR_SIZE)
+        bar_rect.midbottom = (self.screen.get_width() // 2, self.button.rect.top - 12)
+        outline = bar_rect.inflate(4, 4)
+        queue_blit(self.screen, self.render_progress_bar(int(bar_rect.width * self.shown_progress)), outline)
+        text_surface = render_text(self.font_progress, f"Loading {int(self.shown_progress * 100)}%", (255, 255, 255))
+        queue_blit(self.screen, text_surface, text_surface.get_rect(midbottom=(bar_rect.centerx, bar_rect.top - 4)))
+
+    def render_progress_bar(self, filled_width: int) -> pygame.Surface:
+        """The bar with its outline, re-rendered only when the filled width changes so it can be queued like an image."""
+        if self.progress_bar is None or self.progress_bar[0] != filled_width:
+            surface = pygame.Surface((PROGRESS_BAR_SIZE[0] + 4, PROGRESS_BAR_SIZE[1] + 4), pygame.SRCALPHA)
+            surface.fill((0, 0, 0, 0))
+            pygame.draw.rect(surface, (255, 255, 255), surface.get_rect(), border_radius=4)
+            pygame.draw.rect(surface, PROGRESS_BAR_COLOR, (2, 2, filled_width, PROGRESS_BAR_SIZE[1]), border_radius=3)
+            self.progress_bar = (filled_width, surface)
+        return self.progress_bar[1]
+
     def update(self, dt):
+        # The loader adds jobs as it goes, so ease towards the progress and never move back
+        progress = self.game_manager.load_progress()
+        self.shown_progress = max(self.shown_progress, self.shown_progress + (progress - self.shown_progress) * PROGRESS_EASE)
+        self.button.enabled = self.game_manager.is_ready()
+
         buttons = [self.button, self.options_button, self.stats_button]
         mouse_pos = pygame.mouse.get_pos()
         for button in buttons: